@@ -0,0 +1,22 @@
+# Generated by Django 5.1.14 on 2026-10-15 22:25
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0002_customuser_title"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                django.db.models.functions.text.Upper("email"),
+                name="accounts_email_upper_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,45 @@
+"""
+Rebuild the UPPER(email) index with text_pattern_ops on PostgreSQL.
+
+Public portfolio URLs usually carry only the email local part, which
+resolves with ``email__istartswith``. Django compiles that lookup to
+``UPPER(email::text) LIKE UPPER('jane@%')``, and a default b-tree index can
+only serve LIKE under the C collation. A text_pattern_ops index serves both
+the prefix match and ``iexact`` equality, so it replaces the plain index
+from 0003 under the same name instead of adding a second index on the same
+expression. Other backends have no operator classes and keep 0003's index.
+"""
+
+from django.db import migrations
+
+INDEX_NAME = "accounts_email_upper_idx"
+
+
+def _rebuild_index(schema_editor, table: str, expression: str) -> None:
+    schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+    schema_editor.execute(f'CREATE INDEX {INDEX_NAME} ON "{table}" ({expression})')
+
+
+def use_pattern_ops(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    table = apps.get_model("accounts", "CustomUser")._meta.db_table
+    _rebuild_index(schema_editor, table, 'UPPER("email"::text) text_pattern_ops')
+
+
+def use_default_ops(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    table = apps.get_model("accounts", "CustomUser")._meta.db_table
+    _rebuild_index(schema_editor, table, '(UPPER("email"))')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0003_customuser_email_upper_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(use_pattern_ops, use_default_ops),
+    ]
@@ -9,6 +9,7 @@ from typing import Optional
 
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -162,6 +163,11 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
         verbose_name = _("user")
         verbose_name_plural = _("users")
         ordering = ["-date_joined"]
+        indexes = [
+            # Case-insensitive lookups (iexact/istartswith) compare UPPER(email);
+            # migration 0004 rebuilds it with text_pattern_ops on PostgreSQL
+            models.Index(Upper("email"), name="accounts_email_upper_idx"),
+        ]
 
     def __str__(self) -> str:
         """Return string representation of the user."""
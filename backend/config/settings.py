@@ -194,6 +194,13 @@ if USE_CELERY and REDIS_URL:
     CELERY_TIMEZONE: str = "UTC"
     CELERY_TASK_TRACK_STARTED: bool = True
     CELERY_TASK_TIME_LIMIT: int = 30 * 60  # 30 minutes
+    CELERY_BEAT_SCHEDULE = {
+        # Batch-insert public profile/project views buffered in Redis
+        "flush-view-queues": {
+            "task": "portfolio.tasks.flush_view_queues",
+            "schedule": 5.0,
+        },
+    }
 
 
 # =============================================================================
@@ -231,10 +238,10 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.IsAuthenticated",
     ),
     "DEFAULT_RENDERER_CLASSES": (
-        "rest_framework.renderers.JSONRenderer",
+        "core.renderers.ORJSONRenderer",
     ),
     "DEFAULT_PARSER_CLASSES": (
-        "rest_framework.parsers.JSONParser",
+        "core.renderers.ORJSONParser",
         "rest_framework.parsers.MultiPartParser",
         "rest_framework.parsers.FormParser",
     ),
@@ -4,13 +4,56 @@ Pytest configuration and fixtures for DevSync tests.
 This module provides shared fixtures and configuration for all tests.
 """
 
-import pytest
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.urls import reverse
+
 from rest_framework.test import APIClient
 
+import pytest
+
 User = get_user_model()
 
 
+def pytest_configure(config):
+    """Use a fast password hasher; the production hashers are slow by design."""
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Reset the cache around each test so cached responses never leak.
+
+    Yields:
+        None
+    """
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class ReversedURLs(dict):
+    """Mapping of URL name to path that calls reverse() once per name."""
+
+    def __missing__(self, name: str) -> str:
+        self[name] = reverse(name)
+        return self[name]
+
+
+@pytest.fixture(scope="session")
+def urls() -> ReversedURLs:
+    """
+    Provide argument-free URL paths reversed once per session.
+
+    Returns:
+        ReversedURLs: Lazily populated name-to-path mapping.
+    """
+    return ReversedURLs()
+
+
 @pytest.fixture
 def api_client() -> APIClient:
     """
@@ -39,27 +82,48 @@ def user_data() -> dict:
     }
 
 
+@pytest.fixture(scope="session")
+def hash_password():
+    """
+    Hash each distinct test password once per session.
+
+    Password hashing is deliberately slow, and most tests reuse the same
+    few passwords.
+
+    Returns:
+        Callable: Function mapping a raw password to its cached hash.
+    """
+    hashes = {}
+
+    def _hash_password(password: str) -> str:
+        if password not in hashes:
+            hashes[password] = make_password(password)
+        return hashes[password]
+
+    return _hash_password
+
+
 @pytest.fixture
-def create_user(db):
+def create_user(db, hash_password):
     """
     Factory fixture to create users.
 
     Args:
         db: Database fixture to ensure DB access.
+        hash_password: Session cache of password hashes.
 
     Returns:
         Callable: Function to create users.
     """
+
     def _create_user(
-        email: str = "testuser@example.com",
-        password: str = "SecurePass123!",
-        **kwargs
+        email: str = "testuser@example.com", password: str = "SecurePass123!", **kwargs
     ) -> User:
-        return User.objects.create_user(
-            email=email,
-            password=password,
-            **kwargs
-        )
+        user = User.objects.create_user(email=email, password=None, **kwargs)
+        user.password = hash_password(password)
+        user.save(update_fields=["password"])
+        return user
+
     return _create_user
 
 
@@ -0,0 +1,89 @@
+"""
+orjson-backed JSON renderer and parser for DevSync.
+
+These are drop-in replacements for DRF's JSONRenderer and JSONParser that
+encode and decode with orjson. Output is byte-for-byte what DRF would
+produce: types orjson does not handle the same way (datetimes, Decimals,
+lazy translation strings) are passed to DRF's JSON encoder. Any
+configuration the fast path does not cover (indented output, ASCII-only
+output, non-UTF-8 request bodies) falls back to the DRF implementation,
+as does everything when orjson is not installed.
+"""
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """Render JSON responses with orjson."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render data into compact UTF-8 JSON.
+
+        Args:
+            data: The response data.
+            accepted_media_type: The negotiated media type.
+            renderer_context: Context from the view.
+
+        Returns:
+            bytes: The rendered JSON.
+        """
+        if (
+            orjson is None
+            or data is None
+            or not self.compact
+            or self.ensure_ascii
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits; let DRF render or raise
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Match DRF, which escapes these for embedding in JavaScript
+        ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028")
+        return ret.replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+class ORJSONParser(JSONParser):
+    """Parse JSON request bodies with orjson."""
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parse a UTF-8 JSON request body.
+
+        Args:
+            stream: The request body stream.
+            media_type: The request media type.
+            parser_context: Context from the view.
+
+        Returns:
+            The decoded JSON data.
+
+        Raises:
+            ParseError: If the body is not valid JSON.
+        """
+        encoding = (parser_context or {}).get("encoding", "utf-8")
+        if orjson is None or encoding.lower().replace("_", "-") != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
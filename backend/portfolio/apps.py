@@ -11,3 +11,7 @@ class PortfolioConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "portfolio"
     verbose_name = "Portfolio"
+    
+    def ready(self) -> None:
+        """Register signal handlers."""
+        from . import signals  # noqa: F401
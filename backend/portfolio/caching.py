@@ -0,0 +1,106 @@
+"""
+Cache helpers for the portfolio app.
+
+Public portfolio payloads and dashboard statistics (analytics and
+stats counts) are cached under per-user version tokens. Any change to
+the underlying rows replaces the token, so stale payloads are simply
+never read again and expire on their own.
+
+Tokens are dropped only once the surrounding transaction commits. A
+reader running before the commit would otherwise mint a fresh token and
+cache the pre-commit rows under it. Signals cover ordinary saves and
+deletes; writes that send no signals (``update()``, ``bulk_create()``,
+``bulk_update()``) call ``invalidate_user_caches``.
+
+Tokens only work across processes when the cache is shared. With the
+process-local LocMemCache fallback each worker keeps its own tokens and
+never sees another worker's invalidations, so there tokens expire after
+LOCAL_VERSION_TOKEN_TIMEOUT to bound how long stale data can be served.
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+PUBLIC_PORTFOLIO_CACHE_TIMEOUT = 300
+FEATURED_PROJECTS_CACHE_TIMEOUT = 300
+ANALYTICS_CACHE_TIMEOUT = 60
+DASHBOARD_STATS_CACHE_TIMEOUT = 300
+LOCAL_VERSION_TOKEN_TIMEOUT = 60
+
+
+def version_token_timeout():
+    """Return the version token lifetime; None keeps tokens until invalidated."""
+    backend = settings.CACHES["default"]["BACKEND"]
+    if backend == "django.core.cache.backends.locmem.LocMemCache":
+        return LOCAL_VERSION_TOKEN_TIMEOUT
+    return None
+
+
+def _portfolio_version_key(user_id: int) -> str:
+    """Return the cache key holding a user's portfolio version token."""
+    return f"portfolio_version:{user_id}"
+
+
+def get_portfolio_version(user_id: int) -> int:
+    """Return the user's current portfolio version, creating one if needed."""
+    return cache.get_or_set(
+        _portfolio_version_key(user_id), time.time_ns, version_token_timeout()
+    )
+
+
+def public_portfolio_cache_key(user_id: int) -> str:
+    """Return the cache key for the user's current public portfolio payload."""
+    return f"portfolio:{user_id}:{get_portfolio_version(user_id)}"
+
+
+def featured_projects_cache_key(user_id: int) -> str:
+    """
+    Return the cache key for the user's featured projects list.
+
+    Shares the portfolio version token, which every project change and
+    bulk project update already replaces.
+    """
+    return f"featured:{user_id}:{get_portfolio_version(user_id)}"
+
+
+def invalidate_portfolio(user_id: int) -> None:
+    """Drop the user's version token on commit so cached payloads are bypassed."""
+    key = _portfolio_version_key(user_id)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+def _stats_version_key(user_id: int) -> str:
+    """Return the cache key holding a user's dashboard statistics token."""
+    return f"stats_version:{user_id}"
+
+
+def get_stats_version(user_id: int) -> int:
+    """Return the user's current statistics version, creating one if needed."""
+    return cache.get_or_set(
+        _stats_version_key(user_id), time.time_ns, version_token_timeout()
+    )
+
+
+def stats_cache_key(name: str, user_id: int) -> str:
+    """Return the cache key for one of the user's current statistics payloads."""
+    return f"{name}:{user_id}:{get_stats_version(user_id)}"
+
+
+def invalidate_stats(user_id: int) -> None:
+    """Drop the user's statistics token on commit after counted rows change."""
+    key = _stats_version_key(user_id)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+def invalidate_user_caches(user_id: int) -> None:
+    """
+    Drop both of the user's tokens once the transaction commits.
+
+    For writes that bypass the model signals, which would otherwise pick
+    the tokens to drop.
+    """
+    keys = [_portfolio_version_key(user_id), _stats_version_key(user_id)]
+    transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.14 on 2026-10-15 22:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("portfolio", "0004_add_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="certification",
+            name="port_cert_user_expiry_idx",
+        ),
+        migrations.AddIndex(
+            model_name="certification",
+            index=models.Index(
+                condition=models.Q(("expiry_date__isnull", False)),
+                fields=["user", "expiry_date"],
+                name="port_cert_user_expiry_act_idx",
+            ),
+        ),
+    ]
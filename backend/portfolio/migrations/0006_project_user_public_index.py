@@ -0,0 +1,21 @@
+# Generated by Django 5.1.14 on 2026-10-15 22:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("portfolio", "0005_certification_partial_expiry_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["user", "is_public"], name="port_proj_user_public_idx"
+            ),
+        ),
+    ]
@@ -7,6 +7,7 @@ and other portfolio-related content.
 
 from django.conf import settings
 from django.db import models
+from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
 
@@ -140,6 +141,7 @@ class Project(models.Model):
         indexes = [
             models.Index(fields=["user", "status"], name="port_proj_user_status_idx"),
             models.Index(fields=["user", "is_featured"], name="port_proj_user_feat_idx"),
+            models.Index(fields=["user", "is_public"], name="port_proj_user_public_idx"),
             models.Index(fields=["-created_at"], name="port_proj_created_idx"),
             models.Index(fields=["slug"], name="port_proj_slug_idx"),
         ]
@@ -147,17 +149,35 @@ class Project(models.Model):
     def __str__(self) -> str:
         return self.title
     
+    @staticmethod
+    def unique_slug(title: str, taken: set) -> str:
+        """
+        Return a slug for ``title`` that is not already in ``taken``.
+        
+        Shared by ``save()`` and bulk creation, where ``save()`` does not run.
+        The chosen slug is added to ``taken`` so repeated calls stay unique.
+        """
+        base_slug = slugify(title)
+        slug = base_slug
+        counter = 1
+        while slug in taken:
+            slug = f"{base_slug}-{counter}"
+            counter += 1
+        taken.add(slug)
+        return slug
+    
     def save(self, *args, **kwargs):
         """Generate slug from title if not provided."""
         if not self.slug:
-            from django.utils.text import slugify
-            base_slug = slugify(self.title)
-            slug = base_slug
-            counter = 1
-            while Project.objects.filter(user=self.user, slug=slug).exclude(pk=self.pk).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
+            # Every candidate starts with the base slug, so load them at once
+            taken = set(
+                Project.objects.filter(
+                    user_id=self.user_id, slug__startswith=slugify(self.title)
+                )
+                .exclude(pk=self.pk)
+                .values_list("slug", flat=True)
+            )
+            self.slug = Project.unique_slug(self.title, taken)
         super().save(*args, **kwargs)
 
 
@@ -450,7 +470,13 @@ class Certification(models.Model):
         ordering = ["-issue_date"]
         indexes = [
             models.Index(fields=["user", "-issue_date"], name="port_cert_user_date_idx"),
-            models.Index(fields=["user", "expiry_date"], name="port_cert_user_expiry_idx"),
+            # Only certifications with an expiry date take part in
+            # "expiring soon" range scans.
+            models.Index(
+                fields=["user", "expiry_date"],
+                condition=models.Q(expiry_date__isnull=False),
+                name="port_cert_user_expiry_act_idx",
+            ),
         ]
     
     def __str__(self) -> str:
@@ -19,6 +19,15 @@ from reportlab.platypus import (
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 
+from .models import Certification, Education, Experience, Project, Skill
+from .serializers import (
+    CertificationSerializer,
+    EducationSerializer,
+    ExperienceSerializer,
+    ProjectDetailSerializer,
+    SkillSerializer,
+)
+
 
 class ResumeGenerator:
     """Generate professional PDF resumes."""
@@ -43,7 +52,7 @@ class ResumeGenerator:
 
         # Title style
         self.styles.add(ParagraphStyle(
-            name='Title',
+            name='ResumeTitle',
             parent=self.styles['Normal'],
             fontSize=14,
             textColor=colors.HexColor('#6b21a8'),
@@ -89,7 +98,7 @@ class ResumeGenerator:
 
         # Body text
         self.styles.add(ParagraphStyle(
-            name='BodyText',
+            name='ResumeBody',
             parent=self.styles['Normal'],
             fontSize=10,
             textColor=colors.HexColor('#333333'),
@@ -124,7 +133,7 @@ class ResumeGenerator:
 
         # Professional title
         if self.user.get('title'):
-            elements.append(Paragraph(self.user['title'], self.styles['Title']))
+            elements.append(Paragraph(self.user['title'], self.styles['ResumeTitle']))
 
         # Contact info line
         contact_parts = []
@@ -149,7 +158,7 @@ class ResumeGenerator:
             elements.append(Paragraph('PROFESSIONAL SUMMARY', self.styles['SectionHeader']))
             elements.append(HRFlowable(width="100%", thickness=0.5, color=colors.HexColor('#6b21a8')))
             elements.append(Spacer(1, 6))
-            elements.append(Paragraph(self.user['bio'], self.styles['BodyText']))
+            elements.append(Paragraph(self.user['bio'], self.styles['ResumeBody']))
 
     def _add_experience(self, elements):
         """Add work experience section."""
@@ -178,7 +187,7 @@ class ResumeGenerator:
             # Description
             if exp.get('description'):
                 elements.append(Spacer(1, 4))
-                elements.append(Paragraph(exp['description'], self.styles['BodyText']))
+                elements.append(Paragraph(exp['description'], self.styles['ResumeBody']))
 
             elements.append(Spacer(1, 8))
 
@@ -210,7 +219,7 @@ class ResumeGenerator:
 
             if edu.get('description'):
                 elements.append(Spacer(1, 4))
-                elements.append(Paragraph(edu['description'], self.styles['BodyText']))
+                elements.append(Paragraph(edu['description'], self.styles['ResumeBody']))
 
             elements.append(Spacer(1, 8))
 
@@ -234,7 +243,7 @@ class ResumeGenerator:
 
         for category, skill_names in categories.items():
             skill_text = f"<b>{category}:</b> {', '.join(skill_names)}"
-            elements.append(Paragraph(skill_text, self.styles['BodyText']))
+            elements.append(Paragraph(skill_text, self.styles['ResumeBody']))
 
     def _add_projects(self, elements):
         """Add notable projects section."""
@@ -266,7 +275,7 @@ class ResumeGenerator:
                 # Truncate if too long
                 if len(desc) > 200:
                     desc = desc[:200] + '...'
-                elements.append(Paragraph(desc, self.styles['BodyText']))
+                elements.append(Paragraph(desc, self.styles['ResumeBody']))
 
             # Links
             links = []
@@ -293,7 +302,7 @@ class ResumeGenerator:
             cert_text = f"<b>{cert.get('name', '')}</b> - {cert.get('issuing_organization', '')}"
             if cert.get('issue_date'):
                 cert_text += f" ({cert['issue_date'][:7]})"
-            elements.append(Paragraph(cert_text, self.styles['BodyText']))
+            elements.append(Paragraph(cert_text, self.styles['ResumeBody']))
 
     def generate(self) -> bytes:
         """Generate the PDF resume."""
@@ -339,3 +348,51 @@ def generate_resume_pdf(user_data: dict) -> bytes:
     """
     generator = ResumeGenerator(user_data)
     return generator.generate()
+
+
+def collect_resume_data(user) -> dict:
+    """
+    Gather the portfolio data rendered into a user's resume.
+
+    Args:
+        user: The user whose resume is being generated
+
+    Returns:
+        Dictionary in the shape expected by ``generate_resume_pdf``
+    """
+    return {
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "email": user.email,
+        "title": getattr(user, "title", ""),
+        "bio": getattr(user, "bio", ""),
+        "github_username": getattr(user, "github_username", ""),
+        "linkedin_url": getattr(user, "linkedin_url", ""),
+        "portfolio_url": getattr(user, "portfolio_url", ""),
+        "skills": SkillSerializer(
+            Skill.objects.filter(user=user), many=True
+        ).data,
+        "experiences": ExperienceSerializer(
+            Experience.objects.filter(user=user)
+            .prefetch_related("skills")
+            .order_by("-start_date"),
+            many=True,
+        ).data,
+        "education": EducationSerializer(
+            Education.objects.filter(user=user).order_by("-start_date"), many=True
+        ).data,
+        "certifications": CertificationSerializer(
+            Certification.objects.filter(user=user).order_by("-issue_date"), many=True
+        ).data,
+        "projects": ProjectDetailSerializer(
+            Project.objects.filter(user=user, is_public=True)
+            .prefetch_related("skills")
+            .order_by("-is_featured", "-created_at")[:5],
+            many=True
+        ).data,
+    }
+
+
+def resume_filename(user) -> str:
+    """Return the download filename for a user's resume."""
+    return f"{user.first_name or 'resume'}_{user.last_name or 'cv'}.pdf".replace(" ", "_")
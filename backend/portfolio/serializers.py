@@ -5,7 +5,12 @@ This module provides serializers for projects, skills,
 and other portfolio-related models.
 """
 
+from collections.abc import Mapping
+from copy import copy, deepcopy
+
+from django.db import models
 from rest_framework import serializers
+from rest_framework.fields import Field, is_simple_callable
 
 from .models import (
     ActivityLog,
@@ -24,7 +29,97 @@ from .models import (
 )
 
 
-class SkillSerializer(serializers.ModelSerializer):
+class CachedFieldsMixin:
+    """
+    Build a serializer class's fields once and hand out copies.
+    
+    ``ModelSerializer.get_fields`` deep-copies the declared fields and
+    introspects the model on every instantiation. The result only depends
+    on the class, so it is built once per class. Each instance still gets
+    its own field objects, because binding a field mutates it: leaf fields
+    are shallow-copied, while fields that own child fields (nested
+    serializers, many-related fields, list and dict fields) are
+    deep-copied, which re-instantiates them, so their children are never
+    shared.
+    """
+    
+    _fields_cache = {}
+    _deep_copied = (
+        serializers.BaseSerializer,
+        serializers.ManyRelatedField,
+        serializers.ListField,
+        serializers.DictField,
+    )
+    
+    def get_fields(self):
+        cls = type(self)
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+        return {
+            name: deepcopy(field)
+            if isinstance(field, self._deep_copied) else copy(field)
+            for name, field in self._fields_cache[cls].items()
+        }
+
+
+class FastListSerializer(serializers.ListSerializer):
+    """
+    List serializer that reads simple fields straight off each object.
+    
+    ``Field.get_attribute`` walks ``source_attrs``, checks for mappings and
+    inspects callables for every field of every row. When each of the
+    child's fields reads one plain attribute, that lookup is planned once
+    per list from the first row, so each row costs a getattr and a
+    ``to_representation`` per field. Nested, relational and method fields,
+    custom child representations and dict rows use the standard path.
+    """
+    
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        rows = list(iterable)
+        plan = self._plan(rows[0]) if rows else None
+        if plan is None:
+            return [self.child.to_representation(item) for item in rows]
+        
+        result = []
+        for item in rows:
+            ret = {}
+            for name, attr, call, to_representation in plan:
+                value = getattr(item, attr)
+                if call:
+                    value = value()
+                ret[name] = None if value is None else to_representation(value)
+            result.append(ret)
+        return result
+    
+    def _plan(self, sample):
+        """Return (name, attr, call, to_representation) per field, or None."""
+        child = self.child
+        if (
+            isinstance(sample, Mapping)
+            or type(child).to_representation is not serializers.Serializer.to_representation
+        ):
+            return None
+        
+        plan = []
+        for field in child._readable_fields:
+            if (
+                isinstance(field, serializers.BaseSerializer)
+                or type(field).get_attribute is not Field.get_attribute
+                or len(field.source_attrs) != 1
+            ):
+                return None
+            attr = field.source_attrs[0]
+            try:
+                call = is_simple_callable(getattr(sample, attr))
+            except Exception:
+                # Missing relations and builtins get the standard handling
+                return None
+            plan.append((field.field_name, attr, call, field.to_representation))
+        return plan
+
+
+class SkillSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Skill model."""
     
     category_display = serializers.CharField(
@@ -45,6 +140,7 @@ class SkillSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = ["id", "created_at", "updated_at"]
+        list_serializer_class = FastListSerializer
     
     def create(self, validated_data):
         """Create skill with current user."""
@@ -52,7 +148,7 @@ class SkillSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class ProjectListSerializer(serializers.ModelSerializer):
+class ProjectListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for listing projects (minimal data)."""
     
     status_display = serializers.CharField(
@@ -77,9 +173,43 @@ class ProjectListSerializer(serializers.ModelSerializer):
             "is_public",
             "created_at",
         ]
+        list_serializer_class = FastListSerializer
 
 
-class ProjectDetailSerializer(serializers.ModelSerializer):
+class ProjectListDictSerializer(serializers.Serializer):
+    """
+    Read-only twin of ProjectListSerializer for ``.values()`` rows.
+    
+    Renders the same output from plain dicts, so read-only lists can
+    skip building model instances.
+    """
+    
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    slug = serializers.CharField()
+    short_description = serializers.CharField()
+    status = serializers.CharField()
+    status_display = serializers.SerializerMethodField()
+    technologies = serializers.JSONField()
+    github_url = serializers.CharField()
+    live_url = serializers.CharField()
+    featured_image = serializers.SerializerMethodField()
+    is_featured = serializers.BooleanField()
+    is_public = serializers.BooleanField()
+    created_at = serializers.DateTimeField()
+    
+    def get_status_display(self, row: dict) -> str:
+        # Same fallback as Model.get_status_display() for unknown values
+        return str(dict(Project.Status.choices).get(row["status"], row["status"]))
+    
+    def get_featured_image(self, row: dict):
+        name = row["featured_image"]
+        if not name:
+            return None
+        return Project._meta.get_field("featured_image").storage.url(name)
+
+
+class ProjectDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for project details (full data)."""
     
     status_display = serializers.CharField(
@@ -140,7 +270,7 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
         return project
 
 
-class ExperienceSerializer(serializers.ModelSerializer):
+class ExperienceSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Experience model."""
     
     type_display = serializers.CharField(
@@ -194,7 +324,7 @@ class ExperienceSerializer(serializers.ModelSerializer):
         return experience
 
 
-class SocialLinkSerializer(serializers.ModelSerializer):
+class SocialLinkSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for SocialLink model."""
     
     platform_display = serializers.CharField(
@@ -264,7 +394,7 @@ class ContactMessageCreateSerializer(serializers.ModelSerializer):
         fields = ["sender_name", "sender_email", "subject", "message"]
 
 
-class PortfolioThemeSerializer(serializers.ModelSerializer):
+class PortfolioThemeSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for portfolio theme customization."""
     
     preset_display = serializers.CharField(
@@ -301,7 +431,7 @@ class PortfolioThemeSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class EducationSerializer(serializers.ModelSerializer):
+class EducationSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Education model."""
     
     class Meta:
@@ -327,7 +457,7 @@ class EducationSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class CertificationSerializer(serializers.ModelSerializer):
+class CertificationSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Certification model."""
     
     class Meta:
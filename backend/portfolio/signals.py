@@ -0,0 +1,138 @@
+"""
+Signal handlers for the portfolio app.
+
+Keeps cached public portfolio payloads and dashboard statistics in
+sync with the rows they were computed from.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from .caching import invalidate_portfolio, invalidate_stats
+from .models import (
+    ActivityLog,
+    Certification,
+    ContactMessage,
+    Education,
+    Experience,
+    PortfolioTheme,
+    ProfileView,
+    Project,
+    ProjectView,
+    Skill,
+    SocialLink,
+)
+
+User = get_user_model()
+
+# Models rendered on the public portfolio page
+PORTFOLIO_MODELS = (
+    Certification,
+    Education,
+    Experience,
+    PortfolioTheme,
+    Project,
+    Skill,
+    SocialLink,
+)
+
+
+def invalidate_owner_portfolio(sender, instance, **kwargs) -> None:
+    """Invalidate the cached portfolio of the instance's owner."""
+    invalidate_portfolio(instance.user_id)
+
+
+def invalidate_user_portfolio(sender, instance, **kwargs) -> None:
+    """Invalidate the cached portfolio when profile fields change."""
+    invalidate_portfolio(instance.pk)
+
+
+def invalidate_owner_stats(sender, instance, **kwargs) -> None:
+    """Invalidate the cached statistics of the instance's owner."""
+    invalidate_stats(instance.user_id)
+
+
+def invalidate_user_stats(sender, instance, **kwargs) -> None:
+    """Invalidate cached statistics when profile fields change."""
+    invalidate_stats(instance.pk)
+
+
+def invalidate_recipient_stats(sender, instance, **kwargs) -> None:
+    """Invalidate cached message counts of the message's recipient."""
+    invalidate_stats(instance.recipient_id)
+
+
+def invalidate_profile_view_stats(sender, instance, created, **kwargs) -> None:
+    """Invalidate cached statistics when a profile view is recorded."""
+    if created:
+        invalidate_stats(instance.user_id)
+
+
+def invalidate_project_view_stats(sender, instance, created, **kwargs) -> None:
+    """Invalidate cached statistics when a project view is recorded."""
+    if created:
+        invalidate_stats(instance.project.user_id)
+
+
+for model in PORTFOLIO_MODELS:
+    post_save.connect(
+        invalidate_owner_portfolio,
+        sender=model,
+        dispatch_uid=f"portfolio_cache_save_{model.__name__}",
+    )
+    post_delete.connect(
+        invalidate_owner_portfolio,
+        sender=model,
+        dispatch_uid=f"portfolio_cache_delete_{model.__name__}",
+    )
+
+for model in (Project, Experience):
+    m2m_changed.connect(
+        invalidate_owner_portfolio,
+        sender=model.skills.through,
+        dispatch_uid=f"portfolio_cache_skills_{model.__name__}",
+    )
+
+post_save.connect(
+    invalidate_user_portfolio,
+    sender=User,
+    dispatch_uid="portfolio_cache_user",
+)
+
+# Models counted by the dashboard stats and the stats overview
+for model, receiver in (
+    (ActivityLog, invalidate_owner_stats),
+    (Certification, invalidate_owner_stats),
+    (Education, invalidate_owner_stats),
+    (Project, invalidate_owner_stats),
+    (Skill, invalidate_owner_stats),
+    (Experience, invalidate_owner_stats),
+    (SocialLink, invalidate_owner_stats),
+    (ContactMessage, invalidate_recipient_stats),
+):
+    post_save.connect(
+        receiver,
+        sender=model,
+        dispatch_uid=f"stats_cache_save_{model.__name__}",
+    )
+    post_delete.connect(
+        receiver,
+        sender=model,
+        dispatch_uid=f"stats_cache_delete_{model.__name__}",
+    )
+
+post_save.connect(
+    invalidate_user_stats,
+    sender=User,
+    dispatch_uid="stats_cache_user",
+)
+post_save.connect(
+    invalidate_profile_view_stats,
+    sender=ProfileView,
+    dispatch_uid="stats_cache_profile_view",
+)
+post_save.connect(
+    invalidate_project_view_stats,
+    sender=ProjectView,
+    dispatch_uid="stats_cache_project_view",
+)
@@ -0,0 +1,143 @@
+"""
+Celery tasks for the portfolio app.
+
+When Celery and Redis are enabled, public profile and project views are
+buffered in Redis lists instead of being inserted during the request,
+and ``flush_view_queues`` writes them to the database in batches.
+Resume PDFs are rendered by ``generate_resume_pdf_task`` on a worker
+and handed back to the web process through the cache.
+"""
+
+import json
+import uuid
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+import redis
+from celery import shared_task
+
+from .caching import invalidate_user_caches
+from .models import ProfileView, Project, ProjectView
+
+# model -> (Redis list, owning foreign key)
+VIEW_QUEUES = {
+    ProfileView: ("profile_view_queue", "user"),
+    ProjectView: ("project_view_queue", "project"),
+}
+VIEW_FLUSH_BATCH_SIZE = 500
+RESUME_CACHE_TIMEOUT = 60 * 10
+
+_redis_client = None
+
+
+def get_redis() -> redis.Redis:
+    """Return a shared Redis client for the view queues."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(settings.REDIS_URL)
+    return _redis_client
+
+
+def celery_enabled() -> bool:
+    """Return whether a Celery worker is configured to run tasks."""
+    return settings.USE_CELERY and bool(settings.REDIS_URL)
+
+
+def view_queue_enabled() -> bool:
+    """Return whether views are buffered for a Celery worker to flush."""
+    return celery_enabled()
+
+
+def resume_cache_key(task_id: str) -> str:
+    """Cache key holding the result of a resume generation task."""
+    return f"resume:{task_id}"
+
+
+def queue_resume_pdf(user_id: int) -> str:
+    """
+    Enqueue a resume render and return its task id.
+
+    A pending marker is cached before the task is sent, so the status view
+    can tell a queued task from an unknown or expired id.
+    """
+    task_id = str(uuid.uuid4())
+    cache.set(
+        resume_cache_key(task_id),
+        {"user_id": user_id, "pending": True},
+        RESUME_CACHE_TIMEOUT,
+    )
+    generate_resume_pdf_task.apply_async(args=[user_id], task_id=task_id)
+    return task_id
+
+
+def record_view(model, **fields) -> None:
+    """Buffer a view for batch insert, or insert it now without Celery."""
+    if view_queue_enabled():
+        queue, _ = VIEW_QUEUES[model]
+        get_redis().rpush(queue, json.dumps(fields))
+    else:
+        model.objects.create(**fields)
+
+
+def _flush_queue(model) -> int:
+    """Insert up to one batch of buffered views; return how many were popped."""
+    queue, owner = VIEW_QUEUES[model]
+    raw = get_redis().lpop(queue, VIEW_FLUSH_BATCH_SIZE)
+    if not raw:
+        return 0
+
+    rows = [json.loads(item) for item in raw]
+    # Owners deleted since the view was queued would fail the FK check
+    owner_field = model._meta.get_field(owner)
+    live = set(
+        owner_field.related_model.objects.filter(
+            id__in={row[owner_field.attname] for row in rows}
+        ).values_list("id", flat=True)
+    )
+    rows = [row for row in rows if row[owner_field.attname] in live]
+
+    model.objects.bulk_create([model(**row) for row in rows], ignore_conflicts=True)
+
+    # bulk_create sends no post_save, so invalidate statistics here
+    if model is ProfileView:
+        users = live
+    else:
+        users = set(
+            Project.objects.filter(id__in=live).values_list("user_id", flat=True)
+        )
+    for user_id in users:
+        invalidate_user_caches(user_id)
+    return len(raw)
+
+
+@shared_task(ignore_result=True)
+def flush_view_queues() -> None:
+    """Drain the buffered profile and project views into the database."""
+    for model in VIEW_QUEUES:
+        while _flush_queue(model) == VIEW_FLUSH_BATCH_SIZE:
+            pass
+
+
+@shared_task(bind=True, ignore_result=True)
+def generate_resume_pdf_task(self, user_id: int) -> None:
+    """Render a user's resume PDF and store it in the cache for download."""
+    from .pdf_generator import (
+        collect_resume_data,
+        generate_resume_pdf,
+        resume_filename,
+    )
+
+    key = resume_cache_key(self.request.id)
+    try:
+        user = get_user_model().objects.get(pk=user_id)
+        result = {
+            "user_id": user_id,
+            "filename": resume_filename(user),
+            "pdf": generate_resume_pdf(collect_resume_data(user)),
+        }
+    except Exception:
+        cache.set(key, {"user_id": user_id, "failed": True}, RESUME_CACHE_TIMEOUT)
+        raise
+    cache.set(key, result, RESUME_CACHE_TIMEOUT)
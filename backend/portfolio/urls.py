@@ -27,6 +27,7 @@ from .views import (
     ReorderView,
     ResumeDataView,
     ResumeDownloadView,
+    ResumeStatusView,
     SavedDraftViewSet,
     SearchView,
     SkillViewSet,
@@ -60,6 +61,11 @@ urlpatterns = [
     # Resume Data & PDF Download
     path("resume/", ResumeDataView.as_view(), name="resume-data"),
     path("resume/download/", ResumeDownloadView.as_view(), name="resume-download"),
+    path(
+        "resume/download/<str:task_id>/",
+        ResumeStatusView.as_view(),
+        name="resume-status",
+    ),
     # Export Data
     path("export/", ExportDataView.as_view(), name="export-data"),
     # Search
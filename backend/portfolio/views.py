@@ -5,19 +5,62 @@ This module provides API views for projects, skills,
 analytics, and other portfolio-related endpoints.
 """
 
+import hashlib
+import io
+import re
+from collections import Counter
 from datetime import timedelta
 
 import requests as http_requests
 from django.contrib.auth import get_user_model
-from django.db.models import Count, Q
-from django.http import HttpResponse
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    Func,
+    IntegerField,
+    Q,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import TruncDate
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.urls import reverse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
 from rest_framework import generics, permissions, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework.views import APIView
 
+try:
+    import qrcode
+    from qrcode.image.styledpil import StyledPilImage
+    from qrcode.image.styles.moduledrawers import RoundedModuleDrawer
+except ImportError:  # pragma: no cover - optional dependency
+    qrcode = None
+    StyledPilImage = None
+    RoundedModuleDrawer = None
+
+from .caching import (
+    ANALYTICS_CACHE_TIMEOUT,
+    DASHBOARD_STATS_CACHE_TIMEOUT,
+    FEATURED_PROJECTS_CACHE_TIMEOUT,
+    PUBLIC_PORTFOLIO_CACHE_TIMEOUT,
+    featured_projects_cache_key,
+    get_portfolio_version,
+    get_stats_version,
+    invalidate_user_caches,
+    public_portfolio_cache_key,
+    stats_cache_key,
+)
 from .models import (
     ActivityLog,
     Certification,
@@ -44,14 +87,75 @@ from .serializers import (
     ExperienceSerializer,
     PortfolioThemeSerializer,
     ProjectDetailSerializer,
+    ProjectListDictSerializer,
     ProjectListSerializer,
     SavedDraftSerializer,
     SkillSerializer,
     SocialLinkSerializer,
 )
+from .tasks import (
+    celery_enabled,
+    queue_resume_pdf,
+    record_view,
+    resume_cache_key,
+)
 
 User = get_user_model()
 
+# Rendered QR codes only change when the portfolio URL does.
+QR_CODE_CACHE_TIMEOUT = 60 * 60 * 24
+STATS_OVERVIEW_CACHE_TIMEOUT = 45
+EXPORT_CHUNK_SIZE = 200
+
+ONE_WEEK = timedelta(days=7)
+THIRTY_DAYS = timedelta(days=30)
+CERT_EXPIRY_WINDOW = timedelta(days=90)
+
+# Aggregate filters shared by the dashboard, stats and message views
+COMPLETED_Q = Q(status=Project.Status.COMPLETED)
+IN_PROGRESS_Q = Q(status=Project.Status.IN_PROGRESS)
+FEATURED_Q = Q(is_featured=True)
+CURRENT_Q = Q(is_current=True)
+UNREAD_Q = Q(status=ContactMessage.Status.UNREAD)
+# (connect, read) seconds for GitHub API calls
+GITHUB_API_TIMEOUT = (3.05, 10)
+
+# Shared across requests so imports reuse pooled keep-alive connections
+# to api.github.com instead of a fresh TCP + TLS handshake each time.
+github_session = http_requests.Session()
+github_session.headers["Accept"] = "application/vnd.github.v3+json"
+
+
+# Columns read by ProjectListSerializer (and ProjectListDictSerializer);
+# skips description and other wide fields when rendering project lists.
+PROJECT_LIST_ONLY = (
+    "id",
+    "title",
+    "slug",
+    "short_description",
+    "status",
+    "technologies",
+    "github_url",
+    "live_url",
+    "featured_image",
+    "is_featured",
+    "is_public",
+    "created_at",
+)
+
+
+def _filter_pk(queryset: QuerySet, pk) -> QuerySet:
+    """
+    Narrow a queryset to one primary key, raising 404 for malformed keys.
+    
+    Mirrors ``get_object()``, which treats a pk the field cannot convert
+    as not found rather than letting the error surface as a 500.
+    """
+    try:
+        return queryset.filter(pk=pk)
+    except (TypeError, ValueError, ValidationError):
+        raise Http404
+
 
 class ProjectViewSet(viewsets.ModelViewSet):
     """ViewSet for Project CRUD operations."""
@@ -64,20 +168,47 @@ class ProjectViewSet(viewsets.ModelViewSet):
         return ProjectDetailSerializer
     
     def get_queryset(self):
-        return Project.objects.filter(user=self.request.user).prefetch_related("skills")
+        queryset = Project.objects.filter(user=self.request.user)
+        if self.action == "list":
+            # The list serializer renders neither skills nor wide text columns
+            return queryset.only(*PROJECT_LIST_ONLY)
+        return queryset.prefetch_related("skills")
     
     @action(detail=False, methods=["get"])
     def featured(self, request: Request) -> Response:
-        projects = self.get_queryset().filter(is_featured=True)[:6]
-        serializer = ProjectListSerializer(projects, many=True)
-        return Response(serializer.data)
+        response = Response(cache.get_or_set(
+            featured_projects_cache_key(request.user.pk),
+            lambda: self._featured(request.user),
+            FEATURED_PROJECTS_CACHE_TIMEOUT,
+        ))
+        # Per-user payload: keep shared caches from mixing users
+        patch_vary_headers(response, ["Authorization"])
+        return response
+    
+    def _featured(self, user) -> list:
+        # Plain rows: the list output needs no model instances or skills
+        projects = Project.objects.filter(
+            user=user, is_featured=True
+        ).values(*PROJECT_LIST_ONLY)[:6]
+        return list(ProjectListDictSerializer(projects, many=True).data)
     
     @action(detail=True, methods=["post"])
     def toggle_featured(self, request: Request, pk=None) -> Response:
-        project = self.get_object()
-        project.is_featured = not project.is_featured
-        project.save()
-        return Response({"is_featured": project.is_featured})
+        # Flip in a single UPDATE instead of loading and re-saving the row
+        queryset = _filter_pk(self.get_queryset(), pk)
+        updated = queryset.update(
+            is_featured=Case(
+                When(is_featured=True, then=Value(False)), default=Value(True)
+            ),
+            updated_at=timezone.now(),
+        )
+        if not updated:
+            raise Http404
+        # update() bypasses post_save, so invalidate explicitly
+        invalidate_user_caches(request.user.id)
+        return Response(
+            {"is_featured": queryset.values_list("is_featured", flat=True).first()}
+        )
 
 
 class SkillViewSet(viewsets.ModelViewSet):
@@ -91,13 +222,11 @@ class SkillViewSet(viewsets.ModelViewSet):
     
     @action(detail=False, methods=["get"])
     def by_category(self, request: Request) -> Response:
-        skills = self.get_queryset()
+        # Serialize once; rows already carry the category display name
+        data = SkillSerializer(self.get_queryset(), many=True).data
         grouped = {}
-        for skill in skills:
-            category = skill.get_category_display()
-            if category not in grouped:
-                grouped[category] = []
-            grouped[category].append(SkillSerializer(skill).data)
+        for row in data:
+            grouped.setdefault(row["category_display"], []).append(row)
         return Response(grouped)
 
 
@@ -150,30 +279,40 @@ class ContactMessageViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         return ContactMessage.objects.filter(recipient=self.request.user)
     
+    def _update_message(self, pk, **values) -> QuerySet:
+        """Apply a single UPDATE to one of the user's messages or raise 404."""
+        queryset = _filter_pk(self.get_queryset(), pk)
+        if not queryset.update(**values):
+            raise Http404
+        # update() skips post_save, which normally refreshes message counts
+        invalidate_user_caches(self.request.user.pk)
+        return queryset
+    
     @action(detail=True, methods=["post"])
     def mark_read(self, request: Request, pk=None) -> Response:
-        message = self.get_object()
-        message.status = ContactMessage.Status.READ
-        message.save()
+        self._update_message(pk, status=ContactMessage.Status.READ)
         return Response({"status": "read"})
     
     @action(detail=True, methods=["post"])
     def toggle_starred(self, request: Request, pk=None) -> Response:
-        message = self.get_object()
-        message.is_starred = not message.is_starred
-        message.save()
-        return Response({"is_starred": message.is_starred})
+        queryset = self._update_message(
+            pk,
+            is_starred=Case(
+                When(is_starred=True, then=Value(False)), default=Value(True)
+            ),
+        )
+        return Response(
+            {"is_starred": queryset.values_list("is_starred", flat=True).first()}
+        )
     
     @action(detail=True, methods=["post"])
     def archive(self, request: Request, pk=None) -> Response:
-        message = self.get_object()
-        message.status = ContactMessage.Status.ARCHIVED
-        message.save()
+        self._update_message(pk, status=ContactMessage.Status.ARCHIVED)
         return Response({"status": "archived"})
     
     @action(detail=False, methods=["get"])
     def unread_count(self, request: Request) -> Response:
-        count = self.get_queryset().filter(status=ContactMessage.Status.UNREAD).count()
+        count = self.get_queryset().filter(UNREAD_Q).count()
         return Response({"unread_count": count})
 
 
@@ -196,30 +335,62 @@ class PortfolioThemeView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+def _count_subquery(queryset) -> Subquery:
+    """Wrap ``queryset`` as a scalar ``SELECT COUNT(*)`` subquery."""
+    counted = queryset.order_by().annotate(
+        count=Func(F("pk"), function="COUNT")
+    ).values("count")
+    return Subquery(counted, output_field=IntegerField())
+
+
 class DashboardStatsView(APIView):
     """API view for dashboard statistics."""
     
     permission_classes = [permissions.IsAuthenticated]
     
     def get(self, request: Request) -> Response:
-        user = request.user
+        """
+        Return the user's dashboard counts.
         
+        Counts are cached under the user's statistics version, which also
+        serves as the ETag so unchanged dashboards revalidate with a 304.
+        """
+        user = request.user
+        etag = quote_etag(str(get_stats_version(user.id)))
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = Response(cache.get_or_set(
+                stats_cache_key("dashboard", user.id),
+                lambda: self._compute(user),
+                DASHBOARD_STATS_CACHE_TIMEOUT,
+            ))
+        response["ETag"] = etag
+        return response
+    
+    def _compute(self, user) -> dict:
+        """Count everything shown on the dashboard in one query."""
         projects = Project.objects.filter(user=user)
         messages = ContactMessage.objects.filter(recipient=user)
         
-        stats = {
-            "total_projects": projects.count(),
-            "completed_projects": projects.filter(status="completed").count(),
-            "in_progress_projects": projects.filter(status="in_progress").count(),
-            "total_skills": Skill.objects.filter(user=user).count(),
-            "total_experiences": Experience.objects.filter(user=user).count(),
-            "profile_views": ProfileView.objects.filter(user=user).count(),
-            "total_messages": messages.count(),
-            "unread_messages": messages.filter(status=ContactMessage.Status.UNREAD).count(),
+        counts = {
+            "total_projects": projects,
+            "completed_projects": projects.filter(COMPLETED_Q),
+            "in_progress_projects": projects.filter(IN_PROGRESS_Q),
+            "total_skills": Skill.objects.filter(user=user),
+            "total_experiences": Experience.objects.filter(user=user),
+            "profile_views": ProfileView.objects.filter(user=user),
+            "total_messages": messages,
+            "unread_messages": messages.filter(UNREAD_Q),
         }
-        
-        serializer = DashboardStatsSerializer(stats)
-        return Response(serializer.data)
+        # Every count as a scalar subquery on the user's row: one round-trip.
+        # Aliases are prefixed since e.g. profile_views is a reverse relation.
+        row = User.objects.filter(pk=user.pk).values(**{
+            f"stat_{name}": _count_subquery(queryset)
+            for name, queryset in counts.items()
+        }).get()
+        stats = {name: row[f"stat_{name}"] for name in counts}
+        
+        return dict(DashboardStatsSerializer(stats).data)
 
 
 class AnalyticsView(APIView):
@@ -231,19 +402,57 @@ class AnalyticsView(APIView):
         user = request.user
         now = timezone.now()
         today = now.date()
-        week_ago = now - timedelta(days=7)
-        month_ago = now - timedelta(days=30)
+        week_ago = now - ONE_WEEK
+        month_ago = now - THIRTY_DAYS
         
         profile_views = ProfileView.objects.filter(user=user)
         project_views = ProjectView.objects.filter(project__user=user)
         
-        # Views by day for the last 30 days
+        breakdown = cache.get_or_set(
+            stats_cache_key("analytics", user.id),
+            lambda: self._breakdown(user, profile_views, project_views),
+            ANALYTICS_CACHE_TIMEOUT,
+        )
+        
+        profile_view_counts = profile_views.aggregate(
+            total=Count("id"),
+            today=Count("id", filter=Q(viewed_at__date=today)),
+            week=Count("id", filter=Q(viewed_at__gte=week_ago)),
+            month=Count("id", filter=Q(viewed_at__gte=month_ago)),
+        )
+        
+        analytics = {
+            "total_profile_views": profile_view_counts["total"],
+            "total_project_views": project_views.count(),
+            "views_today": profile_view_counts["today"],
+            "views_this_week": profile_view_counts["week"],
+            "views_this_month": profile_view_counts["month"],
+            **breakdown,
+        }
+        
+        serializer = AnalyticsSerializer(analytics)
+        return Response(serializer.data)
+    
+    def _breakdown(self, user, profile_views, project_views) -> dict:
+        """Compute the grouped aggregates cached between recorded views."""
+        now = timezone.now()
+        today = now.date()
+        month_ago = now - THIRTY_DAYS
+        
+        # Views by day for the last 30 days, grouped in the database
+        daily_counts = Counter()
+        for views in (profile_views, project_views):
+            daily_counts.update(dict(
+                views.filter(viewed_at__gte=month_ago)
+                .annotate(day=TruncDate("viewed_at"))
+                .values("day")
+                .annotate(count=Count("id"))
+                .values_list("day", "count")
+            ))
         views_by_day = []
-        for i in range(30):
+        for i in range(29, -1, -1):
             day = today - timedelta(days=i)
-            count = profile_views.filter(viewed_at__date=day).count()
-            count += project_views.filter(viewed_at__date=day).count()
-            views_by_day.append({"date": day.isoformat(), "views": count})
+            views_by_day.append({"date": day.isoformat(), "views": daily_counts[day]})
         
         # Top projects by views
         top_projects = (
@@ -265,20 +474,85 @@ class AnalyticsView(APIView):
         device_counts = profile_views.values("device_type").annotate(count=Count("id"))
         devices = {d["device_type"] or "unknown": d["count"] for d in device_counts}
         
-        analytics = {
-            "total_profile_views": profile_views.count(),
-            "total_project_views": project_views.count(),
-            "views_today": profile_views.filter(viewed_at__date=today).count(),
-            "views_this_week": profile_views.filter(viewed_at__gte=week_ago).count(),
-            "views_this_month": profile_views.filter(viewed_at__gte=month_ago).count(),
+        return {
             "top_projects": list(top_projects),
-            "views_by_day": list(reversed(views_by_day)),
+            "views_by_day": views_by_day,
             "referrers": list(referrers),
             "devices": devices,
         }
-        
-        serializer = AnalyticsSerializer(analytics)
-        return Response(serializer.data)
+
+
+# Single pass over the User-Agent; mobile markers win over tablet ones
+# (iPad Safari reports both "iPad" and "Mobile").
+_DEVICE_RE = re.compile(r"mobile|android|tablet|ipad", re.IGNORECASE)
+_MOBILE_MARKERS = frozenset({"mobile", "android"})
+
+
+def get_client_ip(request: Request):
+    """Return the originating client IP, honouring X-Forwarded-For."""
+    x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+    if x_forwarded_for:
+        return x_forwarded_for.split(",")[0]
+    return request.META.get("REMOTE_ADDR")
+
+
+def get_device_type(user_agent: str) -> str:
+    """Classify a User-Agent string as mobile, tablet or desktop."""
+    markers = {match.lower() for match in _DEVICE_RE.findall(user_agent)}
+    if not markers:
+        return "desktop"
+    if markers & _MOBILE_MARKERS:
+        return "mobile"
+    return "tablet"
+
+
+def _resolve_user(username: str):
+    """
+    Resolve a public portfolio owner from a URL username.
+
+    The username is either a full email address or the local part of
+    one; an ambiguous local part resolves to no user.
+    """
+    if "@" in username:
+        lookup = Q(email__iexact=username)
+    else:
+        lookup = Q(email__istartswith=f"{username}@")
+    users = list(
+        User.objects.filter(lookup)
+        .only("id", "email", "first_name", "last_name", "avatar", "bio", "title")[:2]
+    )
+    return users[0] if len(users) == 1 else None
+
+
+def _serialize_rows(serializer_class, queryset) -> list:
+    """
+    Serialize a queryset, skipping the serializer entirely when it is empty.
+    
+    Sections are often empty for new portfolios; no context is passed since
+    the read serializers don't use it and the result is shared via the cache.
+    """
+    rows = list(queryset)
+    if not rows:
+        return []
+    return serializer_class(rows, many=True).data
+
+
+def _portfolio_validators(user_id: int) -> tuple:
+    """
+    Return the (ETag, Last-Modified) pair for a user's public pages.
+    
+    Both derive from the portfolio version token, which is replaced
+    whenever any public content changes.
+    """
+    version = get_portfolio_version(user_id)
+    return quote_etag(str(version)), version // 1_000_000_000
+
+
+def _set_validators(response, etag: str, last_modified: int):
+    """Attach conditional GET validators to a public response."""
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    return response
 
 
 class PublicPortfolioView(APIView):
@@ -287,23 +561,30 @@ class PublicPortfolioView(APIView):
     permission_classes = [permissions.AllowAny]
     
     def get(self, request: Request, username: str) -> Response:
-        # Try to find user by username/email or by a custom slug
-        try:
-            # First try exact email match
-            user = User.objects.get(email__iexact=username)
-        except User.DoesNotExist:
-            # Try to find by username part of email
-            try:
-                user = User.objects.get(email__istartswith=f"{username}@")
-            except (User.DoesNotExist, User.MultipleObjectsReturned):
-                return Response(
-                    {"error": "Portfolio not found"},
-                    status=status.HTTP_404_NOT_FOUND,
-                )
+        user = _resolve_user(username)
+        if user is None:
+            return Response(
+                {"error": "Portfolio not found"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
         
-        # Track the view
+        # Track the view on every hit, cached or not
         self._track_view(request, user)
         
+        etag, last_modified = _portfolio_validators(user.id)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = Response(cache.get_or_set(
+                public_portfolio_cache_key(user.id),
+                lambda: self._build_portfolio(user),
+                PUBLIC_PORTFOLIO_CACHE_TIMEOUT,
+            ))
+        return _set_validators(response, etag, last_modified)
+    
+    def _build_portfolio(self, user) -> dict:
+        """Serialize the user's public portfolio."""
         # Get theme
         theme = None
         try:
@@ -312,14 +593,16 @@ class PublicPortfolioView(APIView):
             pass
         
         # Get public data
-        projects = Project.objects.filter(user=user, is_public=True)
+        projects = Project.objects.filter(user=user, is_public=True).values(
+            *PROJECT_LIST_ONLY
+        )
         skills = Skill.objects.filter(user=user)
-        experiences = Experience.objects.filter(user=user)
+        experiences = Experience.objects.filter(user=user).prefetch_related("skills")
         education = Education.objects.filter(user=user)
         certifications = Certification.objects.filter(user=user)
         social_links = SocialLink.objects.filter(user=user, is_visible=True)
         
-        return Response({
+        return {
             "user": {
                 "id": user.id,
                 "first_name": user.first_name,
@@ -330,40 +613,26 @@ class PublicPortfolioView(APIView):
                 "avatar": user.avatar.url if user.avatar else None,
             },
             "theme": PortfolioThemeSerializer(theme).data if theme else None,
-            "projects": ProjectListSerializer(projects, many=True).data,
-            "skills": SkillSerializer(skills, many=True).data,
-            "experiences": ExperienceSerializer(experiences, many=True).data,
-            "education": EducationSerializer(education, many=True).data,
-            "certifications": CertificationSerializer(certifications, many=True).data,
-            "social_links": SocialLinkSerializer(social_links, many=True).data,
-        })
+            "projects": _serialize_rows(ProjectListDictSerializer, projects),
+            "skills": _serialize_rows(SkillSerializer, skills),
+            "experiences": _serialize_rows(ExperienceSerializer, experiences),
+            "education": _serialize_rows(EducationSerializer, education),
+            "certifications": _serialize_rows(CertificationSerializer, certifications),
+            "social_links": _serialize_rows(SocialLinkSerializer, social_links),
+        }
     
     def _track_view(self, request: Request, user) -> None:
         """Track portfolio view."""
-        # Get client info
-        x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(",")[0]
-        else:
-            ip = request.META.get("REMOTE_ADDR")
-        
         user_agent = request.META.get("HTTP_USER_AGENT", "")
         referrer = request.META.get("HTTP_REFERER", "")
         
-        # Determine device type
-        device_type = "desktop"
-        ua_lower = user_agent.lower()
-        if "mobile" in ua_lower or "android" in ua_lower:
-            device_type = "mobile"
-        elif "tablet" in ua_lower or "ipad" in ua_lower:
-            device_type = "tablet"
-        
-        ProfileView.objects.create(
-            user=user,
-            visitor_ip=ip,
+        record_view(
+            ProfileView,
+            user_id=user.id,
+            visitor_ip=get_client_ip(request),
             visitor_user_agent=user_agent[:500],
             referrer=referrer[:200] if referrer else "",
-            device_type=device_type,
+            device_type=get_device_type(user_agent),
         )
 
 
@@ -374,16 +643,12 @@ class PublicContactView(APIView):
     
     def post(self, request: Request, username: str) -> Response:
         # Find user
-        try:
-            user = User.objects.get(email__iexact=username)
-        except User.DoesNotExist:
-            try:
-                user = User.objects.get(email__istartswith=f"{username}@")
-            except (User.DoesNotExist, User.MultipleObjectsReturned):
-                return Response(
-                    {"error": "Portfolio not found"},
-                    status=status.HTTP_404_NOT_FOUND,
-                )
+        user = _resolve_user(username)
+        if user is None:
+            return Response(
+                {"error": "Portfolio not found"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
         
         # Check if contact form is enabled
         try:
@@ -413,16 +678,12 @@ class PublicProjectView(APIView):
     
     def get(self, request: Request, username: str, slug: str) -> Response:
         # Find user
-        try:
-            user = User.objects.get(email__iexact=username)
-        except User.DoesNotExist:
-            try:
-                user = User.objects.get(email__istartswith=f"{username}@")
-            except (User.DoesNotExist, User.MultipleObjectsReturned):
-                return Response(
-                    {"error": "Portfolio not found"},
-                    status=status.HTTP_404_NOT_FOUND,
-                )
+        user = _resolve_user(username)
+        if user is None:
+            return Response(
+                {"error": "Portfolio not found"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
         
         # Get project
         try:
@@ -436,19 +697,20 @@ class PublicProjectView(APIView):
         # Track view
         self._track_view(request, project)
         
-        return Response(ProjectDetailSerializer(project).data)
+        etag, last_modified = _portfolio_validators(user.id)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = Response(ProjectDetailSerializer(project).data)
+        return _set_validators(response, etag, last_modified)
     
     def _track_view(self, request: Request, project: Project) -> None:
         """Track project view."""
-        x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(",")[0]
-        else:
-            ip = request.META.get("REMOTE_ADDR")
-        
-        ProjectView.objects.create(
-            project=project,
-            visitor_ip=ip,
+        record_view(
+            ProjectView,
+            project_id=project.id,
+            visitor_ip=get_client_ip(request),
             visitor_user_agent=request.META.get("HTTP_USER_AGENT", "")[:500],
             referrer=request.META.get("HTTP_REFERER", "")[:200],
         )
@@ -474,11 +736,10 @@ class GitHubImportView(APIView):
         
         try:
             # Fetch repos from GitHub API
-            response = http_requests.get(
+            response = github_session.get(
                 f"https://api.github.com/users/{github_username}/repos",
                 params={"sort": "updated", "per_page": 30},
-                headers={"Accept": "application/vnd.github.v3+json"},
-                timeout=10,
+                timeout=GITHUB_API_TIMEOUT,
             )
             response.raise_for_status()
             repos = response.json()
@@ -488,30 +749,40 @@ class GitHubImportView(APIView):
                 status=status.HTTP_502_BAD_GATEWAY,
             )
         
-        imported = []
+        user = request.user
+        repos = [repo for repo in repos if not repo.get("fork")]
+        
+        # Load existing URLs and slugs once instead of querying per repo
+        existing = set(
+            Project.objects.filter(
+                user=user, github_url__in=[repo["html_url"] for repo in repos]
+            ).values_list("github_url", flat=True)
+        )
+        taken_slugs = set(
+            Project.objects.filter(user=user).values_list("slug", flat=True)
+        )
+        
+        new_projects = []
         skipped = []
         
         for repo in repos:
-            if repo.get("fork"):
-                continue
-            
             # Check if already exists
-            if Project.objects.filter(
-                user=request.user,
-                github_url=repo["html_url"]
-            ).exists():
+            if repo["html_url"] in existing:
                 skipped.append(repo["name"])
                 continue
+            existing.add(repo["html_url"])
             
             # Detect technologies from language
             technologies = []
             if repo.get("language"):
                 technologies.append(repo["language"])
             
-            # Create project
-            project = Project.objects.create(
-                user=request.user,
-                title=repo["name"].replace("-", " ").replace("_", " ").title(),
+            title = repo["name"].replace("-", " ").replace("_", " ").title()
+            new_projects.append(Project(
+                user=user,
+                title=title,
+                # bulk_create() bypasses save(), which normally sets the slug
+                slug=Project.unique_slug(title, taken_slugs),
                 description=repo.get("description") or f"A {repo.get('language', '')} project.",
                 short_description=(repo.get("description") or "")[:300],
                 github_url=repo["html_url"],
@@ -519,8 +790,23 @@ class GitHubImportView(APIView):
                 technologies=technologies,
                 status="completed" if not repo.get("archived") else "archived",
                 is_public=not repo.get("private", False),
-            )
-            imported.append(project.title)
+            ))
+        
+        Project.objects.bulk_create(new_projects, ignore_conflicts=True)
+        # ignore_conflicts drops rows silently, so report what was stored
+        stored = set(
+            Project.objects.filter(
+                user=user, slug__in=[project.slug for project in new_projects]
+            ).values_list("slug", "github_url")
+        )
+        imported = [
+            project.title
+            for project in new_projects
+            if (project.slug, project.github_url) in stored
+        ]
+        if imported:
+            # bulk_create() sends no post_save signals
+            invalidate_user_caches(user.pk)
         
         return Response({
             "message": f"Imported {len(imported)} projects",
@@ -552,7 +838,8 @@ class ResumeDataView(APIView):
                 Skill.objects.filter(user=user), many=True
             ).data,
             "experience": ExperienceSerializer(
-                Experience.objects.filter(user=user), many=True
+                Experience.objects.filter(user=user).prefetch_related("skills"),
+                many=True,
             ).data,
             "education": EducationSerializer(
                 Education.objects.filter(user=user), many=True
@@ -561,59 +848,82 @@ class ResumeDataView(APIView):
                 Certification.objects.filter(user=user), many=True
             ).data,
             "projects": ProjectListSerializer(
-                Project.objects.filter(user=user, is_public=True)[:5], many=True
+                Project.objects.filter(user=user, is_public=True)
+                .only(*PROJECT_LIST_ONLY)[:5],
+                many=True,
             ).data,
         })
 
 
+def _pdf_response(pdf_bytes: bytes, filename: str) -> HttpResponse:
+    """Wrap rendered PDF bytes in a download response."""
+    response = HttpResponse(pdf_bytes, content_type="application/pdf")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
 class ResumeDownloadView(APIView):
     """API view for downloading resume as PDF."""
     
     permission_classes = [permissions.IsAuthenticated]
     
     def get(self, request: Request) -> HttpResponse:
-        """Generate and download PDF resume."""
-        from .pdf_generator import generate_resume_pdf
+        """
+        Generate and download PDF resume.
         
+        With Celery enabled the PDF is rendered on a worker and this returns
+        202 with a URL to poll; otherwise it is rendered inline.
+        """
         user = request.user
         
-        # Gather all user data
-        user_data = {
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "email": user.email,
-            "title": getattr(user, "title", ""),
-            "bio": getattr(user, "bio", ""),
-            "github_username": getattr(user, "github_username", ""),
-            "linkedin_url": getattr(user, "linkedin_url", ""),
-            "portfolio_url": getattr(user, "portfolio_url", ""),
-            "skills": SkillSerializer(
-                Skill.objects.filter(user=user), many=True
-            ).data,
-            "experiences": ExperienceSerializer(
-                Experience.objects.filter(user=user).order_by("-start_date"), many=True
-            ).data,
-            "education": EducationSerializer(
-                Education.objects.filter(user=user).order_by("-start_date"), many=True
-            ).data,
-            "certifications": CertificationSerializer(
-                Certification.objects.filter(user=user).order_by("-issue_date"), many=True
-            ).data,
-            "projects": ProjectDetailSerializer(
-                Project.objects.filter(user=user, is_public=True).order_by("-is_featured", "-created_at")[:5],
-                many=True
-            ).data,
-        }
+        if celery_enabled():
+            task_id = queue_resume_pdf(user.id)
+            status_url = request.build_absolute_uri(
+                reverse("portfolio:resume-status", args=[task_id])
+            )
+            return Response(
+                {"task_id": task_id, "status_url": status_url},
+                status=status.HTTP_202_ACCEPTED,
+            )
         
-        # Generate PDF
-        pdf_bytes = generate_resume_pdf(user_data)
+        from .pdf_generator import (
+            collect_resume_data,
+            generate_resume_pdf,
+            resume_filename,
+        )
         
-        # Create response
-        filename = f"{user.first_name or 'resume'}_{user.last_name or 'cv'}.pdf".replace(" ", "_")
-        response = HttpResponse(pdf_bytes, content_type="application/pdf")
-        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        pdf_bytes = generate_resume_pdf(collect_resume_data(user))
+        return _pdf_response(pdf_bytes, resume_filename(user))
+
+
+class ResumeStatusView(APIView):
+    """API view for polling a queued resume PDF."""
+    
+    permission_classes = [permissions.IsAuthenticated]
+    
+    def get(self, request: Request, task_id: str) -> HttpResponse:
+        """
+        Return the PDF once rendered, or 202 while it is still pending.
         
-        return response
+        Unknown, expired and other users' task ids are not found.
+        """
+        result = cache.get(resume_cache_key(task_id))
+        if result is None or result["user_id"] != request.user.id:
+            return Response(
+                {"error": "Resume not found"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        if result.get("pending"):
+            return Response(
+                {"status": "pending"},
+                status=status.HTTP_202_ACCEPTED,
+            )
+        if result.get("failed"):
+            return Response(
+                {"status": "failed", "error": "Resume generation failed"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        return _pdf_response(result["pdf"], result["filename"])
 
 
 class ExportDataView(APIView):
@@ -621,46 +931,58 @@ class ExportDataView(APIView):
     
     permission_classes = [permissions.IsAuthenticated]
     
-    def get(self, request: Request) -> Response:
-        """Export all user portfolio data."""
-        user = request.user
+    def get(self, request: Request) -> StreamingHttpResponse:
+        """
+        Export all user portfolio data.
         
-        data = {
-            "exported_at": timezone.now().isoformat(),
-            "profile": {
-                "email": user.email,
-                "first_name": user.first_name,
-                "last_name": user.last_name,
-                "title": getattr(user, "title", ""),
-                "bio": getattr(user, "bio", ""),
-                "github_username": getattr(user, "github_username", ""),
-                "linkedin_url": getattr(user, "linkedin_url", ""),
-                "portfolio_url": getattr(user, "portfolio_url", ""),
-            },
-            "projects": ProjectDetailSerializer(
-                Project.objects.filter(user=user), many=True
-            ).data,
-            "skills": SkillSerializer(
-                Skill.objects.filter(user=user), many=True
-            ).data,
-            "experiences": ExperienceSerializer(
-                Experience.objects.filter(user=user), many=True
-            ).data,
-            "education": EducationSerializer(
-                Education.objects.filter(user=user), many=True
-            ).data,
-            "certifications": CertificationSerializer(
-                Certification.objects.filter(user=user), many=True
-            ).data,
-            "social_links": SocialLinkSerializer(
-                SocialLink.objects.filter(user=user), many=True
-            ).data,
-            "theme": PortfolioThemeSerializer(
-                PortfolioTheme.objects.filter(user=user).first()
-            ).data if PortfolioTheme.objects.filter(user=user).exists() else None,
+        The JSON document is streamed section by section, serializing one
+        row at a time, so memory stays flat however large the portfolio.
+        """
+        return StreamingHttpResponse(
+            self._stream(request.user),
+            content_type="application/json",
+        )
+    
+    def _stream(self, user):
+        """Yield the export document as JSON fragments."""
+        encode = JSONEncoder().encode
+        profile = {
+            "email": user.email,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "title": getattr(user, "title", ""),
+            "bio": getattr(user, "bio", ""),
+            "github_username": getattr(user, "github_username", ""),
+            "linkedin_url": getattr(user, "linkedin_url", ""),
+            "portfolio_url": getattr(user, "portfolio_url", ""),
         }
+        sections = (
+            ("projects", ProjectDetailSerializer,
+             Project.objects.filter(user=user).prefetch_related("skills")),
+            ("skills", SkillSerializer, Skill.objects.filter(user=user)),
+            ("experiences", ExperienceSerializer,
+             Experience.objects.filter(user=user).prefetch_related("skills")),
+            ("education", EducationSerializer, Education.objects.filter(user=user)),
+            ("certifications", CertificationSerializer,
+             Certification.objects.filter(user=user)),
+            ("social_links", SocialLinkSerializer, SocialLink.objects.filter(user=user)),
+        )
         
-        return Response(data)
+        yield (
+            f'{{"exported_at": {encode(timezone.now().isoformat())}, '
+            f'"profile": {encode(profile)}'
+        )
+        for name, serializer_class, queryset in sections:
+            yield f", {encode(name)}: ["
+            rows = queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+            for index, obj in enumerate(rows):
+                prefix = ", " if index else ""
+                yield prefix + encode(serializer_class(obj).data)
+            yield "]"
+        
+        theme = PortfolioTheme.objects.filter(user=user).first()
+        theme_data = PortfolioThemeSerializer(theme).data if theme else None
+        yield f', "theme": {encode(theme_data)}}}'
 
 
 class ActivityLogViewSet(viewsets.ReadOnlyModelViewSet):
@@ -697,11 +1019,7 @@ def log_activity(user, action: str, model_name: str, obj=None, changes: dict = N
     user_agent = ""
     
     if request:
-        x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-        if x_forwarded_for:
-            ip_address = x_forwarded_for.split(",")[0]
-        else:
-            ip_address = request.META.get("REMOTE_ADDR")
+        ip_address = get_client_ip(request)
         user_agent = request.META.get("HTTP_USER_AGENT", "")[:500]
     
     ActivityLog.objects.create(
@@ -747,7 +1065,7 @@ class SearchView(APIView):
             Q(title__icontains=query) |
             Q(description__icontains=query) |
             Q(short_description__icontains=query)
-        )[:10]
+        ).only(*PROJECT_LIST_ONLY)[:10]
         results["projects"] = ProjectListSerializer(projects, many=True).data
         
         # Search Skills
@@ -764,7 +1082,7 @@ class SearchView(APIView):
             Q(company__icontains=query) |
             Q(position__icontains=query) |
             Q(description__icontains=query)
-        )[:10]
+        ).prefetch_related("skills")[:10]
         results["experiences"] = ExperienceSerializer(experiences, many=True).data
         
         # Search Education
@@ -801,6 +1119,66 @@ class SearchView(APIView):
         return Response(results)
 
 
+def _bulk_delete(request: Request, queryset, model_type: str, ids: list) -> str:
+    """Delete the selected rows and log the deletion."""
+    # The total from delete() includes cascaded rows, so report only
+    # the rows removed from the requested model.
+    _, deleted = queryset.delete()
+    count = deleted.get(queryset.model._meta.label, 0)
+    log_activity(request.user, "delete", model_type.title(),
+                 changes={"deleted_ids": ids, "count": count}, request=request)
+    return f"Deleted {count} {model_type}(s)"
+
+
+def _bulk_archive(request: Request, queryset, model_type: str, ids: list) -> str:
+    """Archive the selected projects and log the change."""
+    count = queryset.update(status=Project.Status.ARCHIVED)
+    # update() sends no signals, so invalidate cached pages here
+    invalidate_user_caches(request.user.pk)
+    log_activity(request.user, "update", "Project",
+                 changes={"archived_ids": ids}, request=request)
+    return f"Archived {count} project(s)"
+
+
+def _bulk_update(message: str, **values):
+    """Build a bulk handler that applies a constant UPDATE."""
+    def handler(request: Request, queryset, model_type: str, ids: list) -> str:
+        count = queryset.update(**values)
+        # update() sends no signals, so invalidate cached pages here
+        invalidate_user_caches(request.user.pk)
+        return message.format(count=count)
+    return handler
+
+
+# model_type -> (model, owner field)
+BULK_MODELS = {
+    "project": (Project, "user"),
+    "skill": (Skill, "user"),
+    "experience": (Experience, "user"),
+    "education": (Education, "user"),
+    "certification": (Certification, "user"),
+    "message": (ContactMessage, "recipient"),
+}
+
+# (operation, model_type) -> handler; "*" matches any model type
+BULK_OPERATIONS = {
+    ("delete", "*"): _bulk_delete,
+    ("archive", "project"): _bulk_archive,
+    ("make_public", "project"): _bulk_update(
+        "Made {count} project(s) public", is_public=True
+    ),
+    ("make_private", "project"): _bulk_update(
+        "Made {count} project(s) private", is_public=False
+    ),
+    ("mark_read", "message"): _bulk_update(
+        "Marked {count} message(s) as read", status=ContactMessage.Status.READ
+    ),
+    ("mark_unread", "message"): _bulk_update(
+        "Marked {count} message(s) as unread", status=ContactMessage.Status.UNREAD
+    ),
+}
+
+
 class BulkOperationsView(APIView):
     """API view for bulk operations on portfolio items."""
     
@@ -817,62 +1195,35 @@ class BulkOperationsView(APIView):
                 "error": "operation, model_type, and ids are required"
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        user = request.user
-        model_map = {
-            "project": Project,
-            "skill": Skill,
-            "experience": Experience,
-            "education": Education,
-            "certification": Certification,
-            "message": ContactMessage,
-        }
+        # Both are used as dict keys, which JSON lists and objects cannot be
+        if not isinstance(operation, str) or not isinstance(model_type, str):
+            return Response({
+                "error": "operation and model_type must be strings"
+            }, status=status.HTTP_400_BAD_REQUEST)
         
-        model_class = model_map.get(model_type.lower())
-        if not model_class:
+        model_key = model_type.lower()
+        if model_key not in BULK_MODELS:
             return Response({
                 "error": f"Invalid model_type: {model_type}"
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Get user's objects only
-        if model_type.lower() == "message":
-            queryset = model_class.objects.filter(recipient=user, id__in=ids)
-        else:
-            queryset = model_class.objects.filter(user=user, id__in=ids)
-        
-        count = queryset.count()
-        
-        if operation == "delete":
-            queryset.delete()
-            log_activity(user, "delete", model_type.title(), 
-                        changes={"deleted_ids": ids, "count": count}, request=request)
-            return Response({"message": f"Deleted {count} {model_type}(s)"})
-        
-        elif operation == "archive" and model_type.lower() == "project":
-            queryset.update(status="archived")
-            log_activity(user, "update", "Project", 
-                        changes={"archived_ids": ids}, request=request)
-            return Response({"message": f"Archived {count} project(s)"})
-        
-        elif operation == "make_public" and model_type.lower() == "project":
-            queryset.update(is_public=True)
-            return Response({"message": f"Made {count} project(s) public"})
-        
-        elif operation == "make_private" and model_type.lower() == "project":
-            queryset.update(is_public=False)
-            return Response({"message": f"Made {count} project(s) private"})
-        
-        elif operation == "mark_read" and model_type.lower() == "message":
-            queryset.update(status=ContactMessage.Status.READ)
-            return Response({"message": f"Marked {count} message(s) as read"})
-        
-        elif operation == "mark_unread" and model_type.lower() == "message":
-            queryset.update(status=ContactMessage.Status.UNREAD)
-            return Response({"message": f"Marked {count} message(s) as unread"})
-        
-        else:
+        handler = (
+            BULK_OPERATIONS.get((operation, model_key))
+            or BULK_OPERATIONS.get((operation, "*"))
+        )
+        if handler is None:
             return Response({
                 "error": f"Invalid operation: {operation}"
             }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Get user's objects only
+        model_class, owner_field = BULK_MODELS[model_key]
+        queryset = model_class.objects.filter(
+            **{owner_field: request.user}, id__in=ids
+        )
+        
+        message = handler(request, queryset, model_type, ids)
+        return Response({"message": message})
 
 
 class QRCodeView(APIView):
@@ -882,13 +1233,7 @@ class QRCodeView(APIView):
     
     def get(self, request: Request) -> HttpResponse:
         """Generate QR code for public portfolio URL."""
-        import io
-        
-        try:
-            import qrcode
-            from qrcode.image.styledpil import StyledPilImage
-            from qrcode.image.styles.moduledrawers import RoundedModuleDrawer
-        except ImportError:
+        if qrcode is None:
             return Response({
                 "error": "QR code generation not available. Install qrcode[pil] package."
             }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
@@ -897,37 +1242,48 @@ class QRCodeView(APIView):
         
         # Get the portfolio URL
         base_url = request.build_absolute_uri("/").rstrip("/")
-        username = user.email.split("@")[0]
+        # Public portfolios are resolved by email local part, not username
+        username = user.email.split("@", 1)[0]
         portfolio_url = f"{base_url}/portfolio/{username}"
         
-        # Generate QR code
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(portfolio_url)
-        qr.make(fit=True)
-        
-        # Create image with rounded modules
-        try:
-            img = qr.make_image(
-                image_factory=StyledPilImage,
-                module_drawer=RoundedModuleDrawer(),
-                fill_color="#8B5CF6",  # Purple
-                back_color="white"
+        url_hash = hashlib.md5(portfolio_url.encode(), usedforsecurity=False).hexdigest()
+        cache_key = f"qrpng:{user.id}:{url_hash}"
+        png_bytes = cache.get(cache_key)
+        
+        if png_bytes is None:
+            # Generate QR code
+            qr = qrcode.QRCode(
+                version=1,
+                error_correction=qrcode.constants.ERROR_CORRECT_L,
+                box_size=10,
+                border=4,
             )
-        except Exception:
-            # Fallback to basic image
-            img = qr.make_image(fill_color="#8B5CF6", back_color="white")
-        
-        # Save to bytes
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        buffer.seek(0)
-        
-        response = HttpResponse(buffer.getvalue(), content_type="image/png")
+            qr.add_data(portfolio_url)
+            qr.make(fit=True)
+            
+            # Create image with rounded modules
+            try:
+                img = qr.make_image(
+                    image_factory=StyledPilImage,
+                    module_drawer=RoundedModuleDrawer(),
+                    fill_color="#8B5CF6",  # Purple
+                    back_color="white"
+                )
+            except Exception:
+                # Fallback to basic image
+                img = qr.make_image(fill_color="#8B5CF6", back_color="white")
+            
+            # Save to bytes
+            buffer = io.BytesIO()
+            # QR codes are low-entropy; zlib level 1 is several times
+            # faster than the default and barely larger.
+            img.save(buffer, format="PNG", optimize=False, compress_level=1)
+            png_bytes = buffer.getvalue()
+            cache.set(cache_key, png_bytes, QR_CODE_CACHE_TIMEOUT)
+        
+        response = HttpResponse(png_bytes, content_type="image/png")
+        # The URL is shared by all users, so only the browser may cache it.
+        response["Cache-Control"] = f"private, max-age={QR_CODE_CACHE_TIMEOUT}"
         response["Content-Disposition"] = f'inline; filename="portfolio_qr_{username}.png"'
         
         return response
@@ -976,12 +1332,34 @@ class SavedDraftViewSet(viewsets.ModelViewSet):
                 "error": "form_type is required"
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        draft, created = SavedDraft.objects.update_or_create(
-            user=request.user,
-            form_type=form_type,
-            object_id=object_id,
-            defaults={"form_data": form_data}
-        )
+        if object_id is None:
+            # NULLs never conflict in a unique index, so an upsert would
+            # insert a duplicate "new item" draft on every save.
+            draft, created = SavedDraft.objects.update_or_create(
+                user=request.user,
+                form_type=form_type,
+                object_id=None,
+                defaults={"form_data": form_data}
+            )
+        else:
+            # Single INSERT ... ON CONFLICT DO UPDATE round trip
+            draft = SavedDraft(
+                user=request.user,
+                form_type=form_type,
+                object_id=object_id,
+                form_data=form_data,
+            )
+            SavedDraft.objects.bulk_create(
+                [draft],
+                update_conflicts=True,
+                update_fields=["form_data", "updated_at"],
+                unique_fields=["user", "form_type", "object_id"],
+            )
+            data = SavedDraftSerializer(draft).data
+            # On conflict the instance holds this request's created_at rather
+            # than the stored one, and reloading would cost a second query
+            del data["created_at"]
+            return Response(data)
         
         return Response(SavedDraftSerializer(draft).data)
     
@@ -1024,10 +1402,24 @@ class ReorderView(APIView):
         user = request.user
         
         if model_type.lower() == "project":
-            for item in items:
-                Project.objects.filter(
-                    user=user, id=item["id"]
-                ).update(order=item["order"])
+            try:
+                orders = {int(item["id"]): int(item["order"]) for item in items}
+            except (KeyError, TypeError, ValueError):
+                return Response({
+                    "error": "Each item needs an integer id and order"
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            # Resolve ownership in one query, then drop foreign ids
+            owned = Project.objects.filter(user=user, id__in=orders).values_list(
+                "id", flat=True
+            )
+            now = timezone.now()
+            Project.objects.bulk_update(
+                [Project(id=pk, order=orders[pk], updated_at=now) for pk in owned],
+                ["order", "updated_at"],
+            )
+            # bulk_update() bypasses post_save, so invalidate explicitly
+            invalidate_user_caches(user.id)
             return Response({"message": "Projects reordered successfully"})
         
         return Response({
@@ -1043,60 +1435,66 @@ class StatsOverviewView(APIView):
     def get(self, request: Request) -> Response:
         """Get comprehensive statistics for the portfolio."""
         user = request.user
+        cache_key = stats_cache_key("overview", user.pk)
+        stats = cache.get(cache_key)
+        if stats is not None:
+            return Response(stats)
+        
         now = timezone.now()
-        month_ago = now - timedelta(days=30)
-        week_ago = now - timedelta(days=7)
+        month_ago = now - THIRTY_DAYS
+        week_ago = now - ONE_WEEK
+        
+        # One aggregate per table; the counts are independent of each other
+        project_stats = Project.objects.filter(user=user).aggregate(
+            total=Count("id"),
+            featured=Count("id", filter=FEATURED_Q),
+            completed=Count("id", filter=COMPLETED_Q),
+            in_progress=Count("id", filter=IN_PROGRESS_Q),
+        )
+        skills_by_category = dict(
+            Skill.objects.filter(user=user)
+            .values("category")
+            .annotate(count=Count("id"))
+            .values_list("category", "count")
+            .iterator()
+        )
+        experience_stats = Experience.objects.filter(user=user).aggregate(
+            total=Count("id"),
+            current=Count("id", filter=CURRENT_Q),
+        )
+        certification_stats = Certification.objects.filter(user=user).aggregate(
+            total=Count("id"),
+            expiring_soon=Count("id", filter=Q(
+                expiry_date__lte=now + CERT_EXPIRY_WINDOW,
+                expiry_date__gte=now,
+            )),
+        )
+        message_stats = ContactMessage.objects.filter(recipient=user).aggregate(
+            total=Count("id"),
+            unread=Count("id", filter=UNREAD_Q),
+            this_week=Count("id", filter=Q(created_at__gte=week_ago)),
+        )
+        view_stats = ProfileView.objects.filter(user=user).aggregate(
+            total_profile=Count("id"),
+            this_month=Count("id", filter=Q(viewed_at__gte=month_ago)),
+            this_week=Count("id", filter=Q(viewed_at__gte=week_ago)),
+        )
         
-        # Basic counts
         stats = {
-            "projects": {
-                "total": Project.objects.filter(user=user).count(),
-                "featured": Project.objects.filter(user=user, is_featured=True).count(),
-                "completed": Project.objects.filter(user=user, status="completed").count(),
-                "in_progress": Project.objects.filter(user=user, status="in_progress").count(),
-            },
+            "projects": project_stats,
             "skills": {
-                "total": Skill.objects.filter(user=user).count(),
-                "by_category": dict(
-                    Skill.objects.filter(user=user)
-                    .values("category")
-                    .annotate(count=Count("id"))
-                    .values_list("category", "count")
-                ),
-            },
-            "experience": {
-                "total": Experience.objects.filter(user=user).count(),
-                "current": Experience.objects.filter(user=user, is_current=True).count(),
+                "total": sum(skills_by_category.values()),
+                "by_category": skills_by_category,
             },
+            "experience": experience_stats,
             "education": {
                 "total": Education.objects.filter(user=user).count(),
             },
-            "certifications": {
-                "total": Certification.objects.filter(user=user).count(),
-                "expiring_soon": Certification.objects.filter(
-                    user=user,
-                    expiry_date__lte=now + timedelta(days=90),
-                    expiry_date__gte=now
-                ).count(),
-            },
-            "messages": {
-                "total": ContactMessage.objects.filter(recipient=user).count(),
-                "unread": ContactMessage.objects.filter(
-                    recipient=user, status=ContactMessage.Status.UNREAD
-                ).count(),
-                "this_week": ContactMessage.objects.filter(
-                    recipient=user, created_at__gte=week_ago
-                ).count(),
-            },
+            "certifications": certification_stats,
+            "messages": message_stats,
             "views": {
-                "total_profile": ProfileView.objects.filter(user=user).count(),
+                **view_stats,
                 "total_projects": ProjectView.objects.filter(project__user=user).count(),
-                "this_month": ProfileView.objects.filter(
-                    user=user, viewed_at__gte=month_ago
-                ).count(),
-                "this_week": ProfileView.objects.filter(
-                    user=user, viewed_at__gte=week_ago
-                ).count(),
             },
             "activity": {
                 "recent_count": ActivityLog.objects.filter(
@@ -1105,16 +1503,16 @@ class StatsOverviewView(APIView):
             },
         }
         
-        # Profile completeness score
+        # Profile completeness score, reusing the counts above
         completeness = 0
         checks = [
             (user.first_name and user.last_name, 10),
             (getattr(user, "bio", ""), 15),
             (getattr(user, "title", ""), 10),
-            (Project.objects.filter(user=user).exists(), 15),
-            (Skill.objects.filter(user=user).count() >= 5, 15),
-            (Experience.objects.filter(user=user).exists(), 10),
-            (Education.objects.filter(user=user).exists(), 10),
+            (project_stats["total"] > 0, 15),
+            (stats["skills"]["total"] >= 5, 15),
+            (experience_stats["total"] > 0, 10),
+            (stats["education"]["total"] > 0, 10),
             (SocialLink.objects.filter(user=user).count() >= 2, 10),
             (user.avatar if hasattr(user, "avatar") else None, 5),
         ]
@@ -1124,5 +1522,6 @@ class StatsOverviewView(APIView):
                 completeness += score
         
         stats["profile_completeness"] = completeness
+        cache.set(cache_key, stats, STATS_OVERVIEW_CACHE_TIMEOUT)
         
         return Response(stats)
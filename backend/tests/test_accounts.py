@@ -7,7 +7,6 @@ and profile management following TDD principles.
 
 import pytest
 from django.contrib.auth import get_user_model
-from django.urls import reverse
 from rest_framework import status
 
 User = get_user_model()
@@ -79,9 +78,9 @@ class TestCustomUserModel:
 class TestUserRegistration:
     """Tests for user registration endpoint."""
 
-    def test_user_registration_successful(self, api_client, user_data):
+    def test_user_registration_successful(self, api_client, user_data, urls):
         """Test successful user registration."""
-        url = reverse("accounts:register")
+        url = urls["accounts:register"]
         response = api_client.post(url, user_data, format="json")
         
         assert response.status_code == status.HTTP_201_CREATED
@@ -89,27 +88,27 @@ class TestUserRegistration:
         assert response.data["user"]["email"] == user_data["email"]
         assert User.objects.filter(email=user_data["email"]).exists()
 
-    def test_user_registration_password_mismatch(self, api_client, user_data):
+    def test_user_registration_password_mismatch(self, api_client, user_data, urls):
         """Test registration fails with password mismatch."""
         user_data["password_confirm"] = "DifferentPass123!"
-        url = reverse("accounts:register")
+        url = urls["accounts:register"]
         response = api_client.post(url, user_data, format="json")
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_user_registration_duplicate_email(self, api_client, create_user, user_data):
+    def test_user_registration_duplicate_email(self, api_client, create_user, user_data, urls):
         """Test registration fails with duplicate email."""
         create_user(email=user_data["email"])
-        url = reverse("accounts:register")
+        url = urls["accounts:register"]
         response = api_client.post(url, user_data, format="json")
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_user_registration_weak_password(self, api_client, user_data):
+    def test_user_registration_weak_password(self, api_client, user_data, urls):
         """Test registration fails with weak password."""
         user_data["password"] = "123"
         user_data["password_confirm"] = "123"
-        url = reverse("accounts:register")
+        url = urls["accounts:register"]
         response = api_client.post(url, user_data, format="json")
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -119,10 +118,10 @@ class TestUserRegistration:
 class TestUserAuthentication:
     """Tests for user authentication endpoints."""
 
-    def test_login_successful(self, api_client, create_user):
+    def test_login_successful(self, api_client, create_user, urls):
         """Test successful login returns tokens."""
         user = create_user(email="login@example.com", password="SecurePass123!")
-        url = reverse("accounts:login")
+        url = urls["accounts:login"]
         response = api_client.post(
             url,
             {"email": "login@example.com", "password": "SecurePass123!"},
@@ -133,10 +132,10 @@ class TestUserAuthentication:
         assert "access" in response.data
         assert "refresh" in response.data
 
-    def test_login_invalid_credentials(self, api_client, create_user):
+    def test_login_invalid_credentials(self, api_client, create_user, urls):
         """Test login fails with invalid credentials."""
         create_user(email="invalid@example.com", password="SecurePass123!")
-        url = reverse("accounts:login")
+        url = urls["accounts:login"]
         response = api_client.post(
             url,
             {"email": "invalid@example.com", "password": "WrongPass123!"},
@@ -145,17 +144,17 @@ class TestUserAuthentication:
         
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_token_refresh(self, api_client, create_user):
+    def test_token_refresh(self, api_client, create_user, urls):
         """Test token refresh endpoint."""
         create_user(email="refresh@example.com", password="SecurePass123!")
-        login_url = reverse("accounts:login")
+        login_url = urls["accounts:login"]
         login_response = api_client.post(
             login_url,
             {"email": "refresh@example.com", "password": "SecurePass123!"},
             format="json",
         )
         
-        refresh_url = reverse("accounts:token_refresh")
+        refresh_url = urls["accounts:token_refresh"]
         response = api_client.post(
             refresh_url,
             {"refresh": login_response.data["refresh"]},
@@ -170,29 +169,30 @@ class TestUserAuthentication:
 class TestUserProfile:
     """Tests for user profile endpoints."""
 
-    def test_get_profile_authenticated(self, authenticated_client):
+    def test_get_profile_authenticated(self, authenticated_client, urls):
         """Test authenticated user can get their profile."""
-        url = reverse("accounts:profile")
+        url = urls["accounts:profile"]
         response = authenticated_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
         assert "email" in response.data
 
-    def test_get_profile_unauthenticated(self, api_client):
+    def test_get_profile_unauthenticated(self, api_client, urls):
         """Test unauthenticated user cannot get profile."""
-        url = reverse("accounts:profile")
+        url = urls["accounts:profile"]
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_update_profile(self, authenticated_client):
+    def test_update_profile(self, authenticated_client, urls, django_assert_num_queries):
         """Test user can update their profile."""
-        url = reverse("accounts:profile")
-        response = authenticated_client.patch(
-            url,
-            {"first_name": "Updated", "bio": "New bio"},
-            format="json",
-        )
+        url = urls["accounts:profile"]
+        with django_assert_num_queries(1):
+            response = authenticated_client.patch(
+                url,
+                {"first_name": "Updated", "bio": "New bio"},
+                format="json",
+            )
         
         assert response.status_code == status.HTTP_200_OK
         assert response.data["first_name"] == "Updated"
@@ -5,35 +5,58 @@ This module contains tests for core functionality including
 health checks and system-level endpoints.
 """
 
+import datetime
+import io
+import uuid
+from decimal import Decimal
+
 import pytest
-from django.urls import reverse
+from django.utils.translation import gettext_lazy
 from rest_framework import status
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from core.renderers import ORJSONParser, ORJSONRenderer
 
 
 @pytest.mark.django_db
 class TestHealthCheck:
     """Tests for the health check endpoint."""
 
-    def test_health_check_returns_healthy(self, api_client):
-        """Test health check returns healthy status."""
-        url = reverse("core:health_check")
-        response = api_client.get(url)
+    def test_health_check_returns_healthy(
+        self, api_client, urls, django_assert_num_queries
+    ):
+        """Test health check reports status, database and version in one query."""
+        with django_assert_num_queries(1):
+            response = api_client.get(urls["core:health_check"])
         
         assert response.status_code == status.HTTP_200_OK
         assert response.data["status"] == "healthy"
-        assert "services" in response.data
-        assert "database" in response.data["services"]
-
-    def test_health_check_database_status(self, api_client):
-        """Test health check includes database status."""
-        url = reverse("core:health_check")
-        response = api_client.get(url)
-        
         assert response.data["services"]["database"]["status"] == "healthy"
-
-    def test_health_check_version(self, api_client):
-        """Test health check includes version."""
-        url = reverse("core:health_check")
-        response = api_client.get(url)
-        
         assert "version" in response.data
+
+
+class TestORJSONRenderer:
+    """Tests for the orjson renderer and parser."""
+
+    def test_matches_drf_output(self):
+        """Test rendered bytes are identical to DRF's JSONRenderer."""
+        data = {
+            "decimal": Decimal("12.50"),
+            "datetime": datetime.datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+            "date": datetime.date(2024, 5, 1),
+            "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "lazy": gettext_lazy("Completed"),
+            "text": "caf\u00e9 \u2028 \u2029",
+            "nested": [{1: None, "ok": True}, (1.5, 2)],
+        }
+
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_parse_round_trip(self):
+        """Test the parser decodes UTF-8 bodies and rejects invalid JSON."""
+        parser = ORJSONParser()
+
+        assert parser.parse(io.BytesIO('{"name": "caf\u00e9"}'.encode())) == {"name": "caf\u00e9"}
+        with pytest.raises(ParseError):
+            parser.parse(io.BytesIO(b"{invalid"))
@@ -0,0 +1,1134 @@
+"""
+Unit tests for the portfolio app.
+
+This module contains tests for portfolio endpoints including
+QR code generation, dashboard statistics and public portfolios.
+"""
+
+import json
+from datetime import timedelta
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import serializers, status
+
+import pytest
+
+from portfolio.caching import (
+    LOCAL_VERSION_TOKEN_TIMEOUT,
+    get_portfolio_version,
+    get_stats_version,
+    invalidate_user_caches,
+    version_token_timeout,
+)
+from portfolio.models import (
+    ContactMessage,
+    Experience,
+    PortfolioTheme,
+    ProfileView,
+    Project,
+    ProjectView,
+    SavedDraft,
+    Skill,
+    SocialLink,
+)
+from portfolio.serializers import (
+    CachedFieldsMixin,
+    ExperienceSerializer,
+    FastListSerializer,
+    ProjectDetailSerializer,
+    ProjectListDictSerializer,
+    ProjectListSerializer,
+    SavedDraftSerializer,
+    SkillSerializer,
+)
+from portfolio.tasks import flush_view_queues, generate_resume_pdf_task
+from portfolio.views import PROJECT_LIST_ONLY, get_device_type
+
+
+@pytest.fixture
+def owner(api_client, create_user):
+    """
+    Create a user and authenticate the API client as them.
+
+    Args:
+        api_client: Base API client fixture.
+        create_user: User creation fixture.
+
+    Returns:
+        User: The authenticated user.
+    """
+    user = create_user()
+    api_client.force_authenticate(user=user)
+    return user
+
+
+@pytest.mark.django_db
+class TestQRCode:
+    """Tests for the portfolio QR code endpoint."""
+
+    def test_qr_code_returns_png(self, authenticated_client):
+        """Test QR code endpoint returns a PNG image."""
+        url = reverse("portfolio:qr-code")
+        response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "image/png"
+        assert response.content.startswith(b"\x89PNG")
+        assert "private" in response["Cache-Control"]
+
+    def test_qr_code_is_cached(self, authenticated_client):
+        """Test repeated requests reuse the cached PNG."""
+        url = reverse("portfolio:qr-code")
+        first = authenticated_client.get(url)
+
+        with mock.patch("qrcode.QRCode") as qr_class:
+            second = authenticated_client.get(url)
+
+        qr_class.assert_not_called()
+        assert second.content == first.content
+
+
+@pytest.mark.django_db
+class TestToggleActions:
+    """Tests for the single-UPDATE toggle and mark actions."""
+
+    def test_toggle_featured_flips_value(
+        self, api_client, owner, django_capture_on_commit_callbacks
+    ):
+        """Test toggle_featured flips the value and refreshes cached stats."""
+        project = Project.objects.create(user=owner, title="One", description="x")
+        url = reverse("portfolio:project-toggle-featured", args=[project.id])
+
+        overview_url = reverse("portfolio:stats-overview")
+        assert api_client.get(overview_url).data["projects"]["featured"] == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            assert api_client.post(url).data == {"is_featured": True}
+        assert api_client.get(overview_url).data["projects"]["featured"] == 1
+        assert api_client.post(url).data == {"is_featured": False}
+        project.refresh_from_db()
+        assert project.is_featured is False
+
+    def test_toggle_featured_other_user_is_404(self, api_client, owner, create_user):
+        """Test toggling another user's project is not found."""
+        other = create_user(email="other@example.com")
+        project = Project.objects.create(user=other, title="X", description="x")
+        url = reverse("portfolio:project-toggle-featured", args=[project.id])
+
+        response = api_client.post(url)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        project.refresh_from_db()
+        assert project.is_featured is False
+
+    @pytest.mark.parametrize(
+        "url_name",
+        [
+            "project-toggle-featured",
+            "message-mark-read",
+            "message-toggle-starred",
+            "message-archive",
+        ],
+    )
+    def test_malformed_pk_is_404(self, api_client, owner, url_name):
+        """Test non-numeric primary keys are not found rather than errors."""
+        response = api_client.post(reverse(f"portfolio:{url_name}", args=["abc"]))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_message_actions(self, api_client, owner):
+        """Test mark_read, toggle_starred and archive update the message."""
+        message = ContactMessage.objects.create(
+            recipient=owner,
+            sender_name="Ann",
+            sender_email="ann@example.com",
+            subject="Hi",
+            message="Hello",
+        )
+
+        api_client.post(reverse("portfolio:message-mark-read", args=[message.id]))
+        message.refresh_from_db()
+        assert message.status == ContactMessage.Status.READ
+
+        url = reverse("portfolio:message-toggle-starred", args=[message.id])
+        assert api_client.post(url).data == {"is_starred": True}
+
+        api_client.post(reverse("portfolio:message-archive", args=[message.id]))
+        message.refresh_from_db()
+        assert message.status == ContactMessage.Status.ARCHIVED
+        assert message.is_starred is True
+
+
+@pytest.mark.django_db
+class TestFeaturedProjects:
+    """Tests for dict-based project list rendering."""
+
+    def test_dict_serializer_matches_model_serializer(self, owner):
+        """Test .values() rows render exactly like model instances."""
+        Project.objects.create(
+            user=owner,
+            title="One",
+            description="x",
+            technologies=["Python"],
+            status=Project.Status.COMPLETED,
+        )
+        Project.objects.create(user=owner, title="Two", description="x")
+        Project.objects.filter(title="Two").update(featured_image="projects/two.png")
+        projects = Project.objects.filter(user=owner).order_by("id")
+
+        expected = ProjectListSerializer(projects, many=True).data
+        rows = ProjectListDictSerializer(
+            projects.values(*PROJECT_LIST_ONLY), many=True
+        ).data
+
+        assert json.loads(json.dumps(rows)) == json.loads(json.dumps(expected))
+        assert rows[1]["featured_image"].endswith("projects/two.png")
+
+    def test_list_skips_skills_and_wide_columns(
+        self, api_client, owner, django_assert_max_num_queries
+    ):
+        """Test the list action loads only list columns without prefetching."""
+        for title in ("One", "Two", "Three"):
+            Project.objects.create(user=owner, title=title, description="x")
+
+        with django_assert_max_num_queries(2) as queries:
+            response = api_client.get(reverse("portfolio:project-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        sql = queries.captured_queries[-1]["sql"]
+        assert '"description"' not in sql
+        assert "skills" not in sql
+
+    def test_featured_lists_only_featured(self, api_client, owner):
+        """Test the featured action returns the user's featured projects."""
+        Project.objects.create(
+            user=owner, title="One", description="x", is_featured=True
+        )
+        Project.objects.create(user=owner, title="Two", description="x")
+
+        response = api_client.get(reverse("portfolio:project-featured"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [p["title"] for p in response.data] == ["One"]
+        assert response.data[0]["status_display"]
+        assert "Authorization" in response["Vary"]
+
+    def test_featured_cached_until_projects_change(
+        self,
+        api_client,
+        owner,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test featured lists are cached and refreshed by project changes."""
+        project = Project.objects.create(user=owner, title="One", description="x")
+        url = reverse("portfolio:project-featured")
+        assert api_client.get(url).data == []
+
+        with django_assert_num_queries(0):
+            api_client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.post(
+                reverse("portfolio:project-toggle-featured", args=[project.id])
+            )
+        assert [p["title"] for p in api_client.get(url).data] == ["One"]
+
+        project.refresh_from_db()
+        project.title = "Renamed"
+        with django_capture_on_commit_callbacks(execute=True):
+            project.save()
+        assert [p["title"] for p in api_client.get(url).data] == ["Renamed"]
+
+
+@pytest.mark.django_db
+class TestCachedFields:
+    """Tests for per-class serializer field caching."""
+
+    def test_fields_built_once_and_copied(self, owner):
+        """Test instances share cached fields only through copies."""
+        first, second = SkillSerializer(), SkillSerializer()
+
+        assert first.fields.keys() == second.fields.keys()
+        assert first.fields["name"] is not second.fields["name"]
+        assert first.fields["name"].parent is first
+        assert second.fields["name"].parent is second
+        assert SkillSerializer in CachedFieldsMixin._fields_cache
+
+    def test_nested_serializers_not_shared(self, owner):
+        """Test nested serializer fields are rebuilt for every instance."""
+        first, second = ExperienceSerializer(), ExperienceSerializer()
+
+        assert first.fields["skills"] is not second.fields["skills"]
+        assert first.fields["skills"].child is not second.fields["skills"].child
+        assert first.fields["skills"].parent is first
+        assert first.fields["position"] is not second.fields["position"]
+
+    def test_many_related_children_not_shared(self, owner):
+        """Test write-only many-related fields get their own child relation."""
+        first, second = ProjectDetailSerializer(), ProjectDetailSerializer()
+        first_ids, second_ids = first.fields["skill_ids"], second.fields["skill_ids"]
+
+        assert first_ids.child_relation is not second_ids.child_relation
+        assert first_ids.child_relation.parent is first_ids
+
+    def test_cached_fields_still_validate(self, owner):
+        """Test validation works with copied fields."""
+        serializer = SkillSerializer(data={"name": "Python", "category": "bogus"})
+
+        assert not serializer.is_valid()
+        assert set(serializer.errors) == {"category"}
+        assert SkillSerializer(data={"name": "Python"}).is_valid()
+
+    def test_fast_list_matches_standard_path(self, owner):
+        """Test the fast list path renders exactly like ListSerializer."""
+        skill = Skill.objects.create(user=owner, name="Python", years_experience=2.5)
+        Project.objects.create(user=owner, title="One", description="x")
+        Project.objects.create(
+            user=owner, title="Two", description="x", featured_image="projects/two.png"
+        )
+        experience = Experience.objects.create(
+            user=owner, company="Acme", position="Dev", start_date="2024-01-01"
+        )
+        experience.skills.add(skill)
+
+        for serializer_class, queryset in (
+            (SkillSerializer, Skill.objects.filter(user=owner)),
+            (ProjectListSerializer, Project.objects.filter(user=owner).order_by("id")),
+            (ExperienceSerializer, Experience.objects.prefetch_related("skills")),
+        ):
+            fast = serializer_class(queryset, many=True)
+            standard = serializers.ListSerializer(queryset, child=serializer_class())
+
+            assert fast.data == standard.data
+
+        assert isinstance(SkillSerializer(many=True), FastListSerializer)
+        assert ExperienceSerializer(experience).data["skills"][0]["name"] == "Python"
+
+
+@pytest.mark.django_db
+class TestListQueryCounts:
+    """Characterization tests: list endpoints issue no per-row queries."""
+
+    @staticmethod
+    def _count_queries(api_client, url):
+        with CaptureQueriesContext(connection) as queries:
+            assert api_client.get(url).status_code == status.HTTP_200_OK
+        return len(queries)
+
+    @pytest.mark.parametrize(
+        "url_name",
+        ["project-list", "skill-list", "experience-list", "social-link-list"],
+    )
+    def test_query_count_independent_of_rows(self, api_client, owner, url_name):
+        """Test adding rows does not add queries."""
+        skill = Skill.objects.create(user=owner, name="Skill 0")
+
+        def add_rows(index):
+            project = Project.objects.create(
+                user=owner, title=f"P{index}", description="x"
+            )
+            project.skills.add(skill)
+            experience = Experience.objects.create(
+                user=owner,
+                company=f"C{index}",
+                position="Dev",
+                start_date=timezone.now().date(),
+            )
+            experience.skills.add(skill)
+            Skill.objects.create(user=owner, name=f"Skill {index + 1}")
+            platform = list(SocialLink.Platform)[index]
+            SocialLink.objects.create(
+                user=owner, platform=platform, url=f"https://e.com/{index}"
+            )
+
+        url = reverse(f"portfolio:{url_name}")
+        add_rows(0)
+        baseline = self._count_queries(api_client, url)
+        for index in range(1, 4):
+            add_rows(index)
+
+        assert self._count_queries(api_client, url) == baseline
+
+
+@pytest.mark.django_db
+class TestBulkOperations:
+    """Tests for the bulk operations endpoint."""
+
+    @pytest.mark.parametrize(
+        ("operation", "model_type"),
+        [
+            (["delete"], "project"),
+            ({"op": "delete"}, "project"),
+            ("delete", ["project"]),
+        ],
+    )
+    def test_non_string_operation_is_400(
+        self, api_client, owner, operation, model_type
+    ):
+        """Test list or object values are rejected instead of raising."""
+        response = api_client.post(
+            reverse("portfolio:bulk-operations"),
+            {"operation": operation, "model_type": model_type, "ids": [1]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_bulk_delete_reports_deleted_rows(self, api_client, owner):
+        """Test bulk delete counts only rows of the requested model."""
+        skill = Skill.objects.create(user=owner, name="Python")
+        project = Project.objects.create(user=owner, title="One", description="x")
+        project.skills.add(skill)
+        Project.objects.create(user=owner, title="Two", description="x")
+
+        url = reverse("portfolio:bulk-operations")
+        response = api_client.post(
+            url,
+            {"operation": "delete", "model_type": "project", "ids": [project.id]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["message"] == "Deleted 1 project(s)"
+        assert Project.objects.filter(user=owner).count() == 1
+
+    def test_bulk_update_ignores_other_users(self, api_client, owner, create_user):
+        """Test bulk updates only touch the caller's rows."""
+        other = create_user(email="other@example.com")
+        mine = Project.objects.create(user=owner, title="Mine", description="x")
+        theirs = Project.objects.create(user=other, title="Theirs", description="x")
+
+        url = reverse("portfolio:bulk-operations")
+        response = api_client.post(
+            url,
+            {
+                "operation": "make_private",
+                "model_type": "project",
+                "ids": [mine.id, theirs.id],
+            },
+            format="json",
+        )
+
+        assert response.data["message"] == "Made 1 project(s) private"
+        theirs.refresh_from_db()
+        assert theirs.is_public
+
+
+@pytest.mark.django_db
+class TestSavedDrafts:
+    """Tests for saved draft endpoints."""
+
+    @pytest.mark.parametrize("object_id", [None, 7])
+    def test_save_draft_updates_existing(self, api_client, owner, object_id):
+        """Test saving twice keeps a single draft with the latest data."""
+        url = reverse("portfolio:draft-save-draft")
+        for title in ("first", "second"):
+            # Backdate the stored row so a stale created_at would show
+            SavedDraft.objects.filter(user=owner).update(
+                created_at=timezone.now() - timedelta(days=1)
+            )
+            response = api_client.post(
+                url,
+                {
+                    "form_type": "project",
+                    "object_id": object_id,
+                    "form_data": {"title": title},
+                },
+                format="json",
+            )
+            assert response.status_code == status.HTTP_200_OK
+
+        drafts = SavedDraft.objects.filter(user=owner, form_type="project")
+        assert drafts.count() == 1
+        draft = drafts.get()
+        assert draft.form_data == {"title": "second"}
+        assert response.data["id"] == draft.id
+        if object_id is None:
+            stored = SavedDraftSerializer(draft).data
+            assert response.data["created_at"] == stored["created_at"]
+        else:
+            # The upsert response never reports a created_at it did not store
+            assert "created_at" not in response.data
+
+    def test_upsert_is_one_query(self, api_client, owner, django_assert_num_queries):
+        """Test saving an edit draft is a single INSERT ... ON CONFLICT."""
+        payload = {"form_type": "project", "object_id": 7, "form_data": {}}
+        url = reverse("portfolio:draft-save-draft")
+        api_client.post(url, payload, format="json")
+
+        with django_assert_num_queries(1):
+            api_client.post(url, payload, format="json")
+
+
+@pytest.mark.django_db
+class TestReorder:
+    """Tests for the reorder endpoint."""
+
+    def test_reorder_projects_skips_foreign_ids(self, api_client, owner, create_user):
+        """Test reordering updates own projects and ignores others."""
+        other = create_user(email="other@example.com")
+        first = Project.objects.create(user=owner, title="First", description="x")
+        second = Project.objects.create(user=owner, title="Second", description="x")
+        foreign = Project.objects.create(user=other, title="Foreign", description="x")
+
+        url = reverse("portfolio:reorder")
+        response = api_client.post(
+            url,
+            {
+                "model_type": "project",
+                "items": [
+                    {"id": first.id, "order": 2},
+                    {"id": second.id, "order": 1},
+                    {"id": foreign.id, "order": 9},
+                ],
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        orders = dict(Project.objects.values_list("id", "order"))
+        assert orders == {first.id: 2, second.id: 1, foreign.id: 0}
+
+    def test_reorder_refreshes_public_validators(
+        self, api_client, owner, django_capture_on_commit_callbacks
+    ):
+        """Test reordering by string ids issues a new ETag for public pages."""
+        project = Project.objects.create(user=owner, title="One", description="x")
+        project_url = reverse(
+            "portfolio:public-project", args=["testuser", project.slug]
+        )
+        etag = api_client.get(project_url)["ETag"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(
+                reverse("portfolio:reorder"),
+                {
+                    "model_type": "project",
+                    "items": [{"id": str(project.id), "order": 3}],
+                },
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        response = api_client.get(project_url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["order"] == 3
+
+    def test_reorder_rejects_invalid_ids(self, api_client, owner):
+        """Test non-integer ids are rejected instead of silently skipped."""
+        response = api_client.post(
+            reverse("portfolio:reorder"),
+            {"model_type": "project", "items": [{"id": "abc", "order": 1}]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestDashboardStats:
+    """Tests for the dashboard stats endpoint."""
+
+    def test_dashboard_stats_single_query(
+        self, api_client, owner, django_assert_num_queries
+    ):
+        """Test every dashboard count comes from one query."""
+        Skill.objects.create(user=owner, name="Python")
+        ProfileView.objects.create(user=owner)
+        url = reverse("portfolio:dashboard-stats")
+
+        with django_assert_num_queries(1):
+            response = api_client.get(url)
+
+        assert response.data["total_skills"] == 1
+        assert response.data["profile_views"] == 1
+
+    def test_dashboard_stats_cached_until_change(
+        self,
+        api_client,
+        owner,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test cached counts refresh on saves and UPDATE-only actions."""
+        url = reverse("portfolio:dashboard-stats")
+        etag = api_client.get(url)["ETag"]
+
+        with django_assert_num_queries(0):
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        with django_capture_on_commit_callbacks(execute=True):
+            message = ContactMessage.objects.create(
+                recipient=owner,
+                sender_name="A",
+                sender_email="a@example.com",
+                subject="Hi",
+                message="Hello",
+            )
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["unread_messages"] == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.post(reverse("portfolio:message-mark-read", args=[message.id]))
+        assert api_client.get(url).data["unread_messages"] == 0
+
+    def test_dashboard_stats_counts(self, api_client, owner):
+        """Test dashboard stats report project and message counts."""
+        Project.objects.create(
+            user=owner, title="Done", description="x", status="completed"
+        )
+        Project.objects.create(user=owner, title="WIP", description="x")
+        ContactMessage.objects.create(
+            recipient=owner,
+            sender_name="A",
+            sender_email="a@example.com",
+            subject="Hi",
+            message="Hello",
+        )
+        ContactMessage.objects.create(
+            recipient=owner,
+            sender_name="B",
+            sender_email="b@example.com",
+            subject="Hi",
+            message="Hello",
+            status="read",
+        )
+
+        response = api_client.get(reverse("portfolio:dashboard-stats"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "total_projects": 2,
+            "completed_projects": 1,
+            "in_progress_projects": 1,
+            "total_skills": 0,
+            "total_experiences": 0,
+            "profile_views": 0,
+            "total_messages": 2,
+            "unread_messages": 1,
+        }
+
+
+@pytest.mark.django_db
+def test_user_caches_invalidated_on_commit(django_capture_on_commit_callbacks):
+    """Test both tokens survive until the transaction commits, then change."""
+    versions = (get_portfolio_version(1), get_stats_version(1))
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        invalidate_user_caches(1)
+        assert (get_portfolio_version(1), get_stats_version(1)) == versions
+
+    assert len(callbacks) == 1
+    assert get_portfolio_version(1) != versions[0]
+    assert get_stats_version(1) != versions[1]
+
+
+def test_version_tokens_expire_on_process_local_cache(settings):
+    """Test tokens only live forever when the cache is shared between workers."""
+    assert version_token_timeout() == LOCAL_VERSION_TOKEN_TIMEOUT
+
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": "redis://localhost:6379/0",
+        }
+    }
+    assert version_token_timeout() is None
+
+
+@pytest.mark.django_db
+class TestStatsOverview:
+    """Tests for the stats overview endpoint."""
+
+    def test_stats_overview_counts(self, api_client, owner):
+        """Test stats overview aggregates per-model counts."""
+        Project.objects.create(
+            user=owner,
+            title="Done",
+            description="x",
+            status="completed",
+            is_featured=True,
+        )
+        Project.objects.create(user=owner, title="WIP", description="x")
+        Skill.objects.create(user=owner, name="Python", category="backend")
+        Skill.objects.create(user=owner, name="React", category="frontend")
+        Skill.objects.create(user=owner, name="Django", category="backend")
+
+        url = reverse("portfolio:stats-overview")
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["projects"] == {
+            "total": 2,
+            "featured": 1,
+            "completed": 1,
+            "in_progress": 1,
+        }
+        assert response.data["skills"] == {
+            "total": 3,
+            "by_category": {"backend": 2, "frontend": 1},
+        }
+        assert response.data["messages"]["unread"] == 0
+        assert response.data["profile_completeness"] == 15
+
+    def test_stats_overview_cached_until_data_changes(
+        self,
+        api_client,
+        owner,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test stats are served from cache and refreshed by model changes."""
+        url = reverse("portfolio:stats-overview")
+        api_client.get(url)
+        with django_assert_num_queries(0):
+            api_client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.post(
+                reverse("portfolio:project-list"),
+                {"title": "New", "description": "x"},
+                format="json",
+            )
+
+        assert api_client.get(url).data["projects"]["total"] == 1
+
+
+@pytest.mark.django_db
+class TestAnalytics:
+    """Tests for the analytics endpoint."""
+
+    def test_views_by_day_merges_profile_and_project_views(self, api_client, owner):
+        """Test daily views combine both view tables over 30 days."""
+        project = Project.objects.create(user=owner, title="One", description="x")
+        ProfileView.objects.create(user=owner)
+        ProjectView.objects.create(project=project)
+        old = ProfileView.objects.create(user=owner)
+        ProfileView.objects.filter(pk=old.pk).update(
+            viewed_at=timezone.now() - timedelta(days=3)
+        )
+
+        url = reverse("portfolio:analytics")
+        response = api_client.get(url)
+
+        views_by_day = response.data["views_by_day"]
+        today = timezone.now().date()
+        assert len(views_by_day) == 30
+        assert views_by_day[-1] == {"date": today.isoformat(), "views": 2}
+        assert views_by_day[-4]["views"] == 1
+        assert sum(day["views"] for day in views_by_day) == 3
+
+    def test_view_totals(self, api_client, owner):
+        """Test profile view buckets are counted from one aggregate."""
+        ProfileView.objects.create(user=owner)
+        old = ProfileView.objects.create(user=owner)
+        ProfileView.objects.filter(pk=old.pk).update(
+            viewed_at=timezone.now() - timedelta(days=10)
+        )
+
+        response = api_client.get(reverse("portfolio:analytics"))
+
+        assert response.data["total_profile_views"] == 2
+        assert response.data["views_today"] == 1
+        assert response.data["views_this_week"] == 1
+        assert response.data["views_this_month"] == 2
+
+    def test_breakdown_cached_until_new_view(
+        self, api_client, owner, django_capture_on_commit_callbacks
+    ):
+        """Test grouped aggregates are reused until a view is recorded."""
+        project = Project.objects.create(user=owner, title="One", description="x")
+        url = reverse("portfolio:analytics")
+        api_client.get(url)
+
+        ProjectView.objects.bulk_create([ProjectView(project=project)])
+        response = api_client.get(url)
+        assert response.data["top_projects"][0]["view_count"] == 0
+        assert response.data["total_project_views"] == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            ProjectView.objects.create(project=project)
+        response = api_client.get(url)
+        assert response.data["top_projects"][0]["view_count"] == 2
+
+
+@pytest.mark.django_db
+class TestPublicPortfolio:
+    """Tests for the public portfolio endpoint."""
+
+    @pytest.mark.parametrize("username", ["jane", "Jane@Example.com"])
+    def test_resolves_user_by_email_or_local_part(
+        self, api_client, create_user, username
+    ):
+        """Test portfolios resolve by full email or its local part."""
+        user = create_user(email="jane@example.com")
+
+        url = reverse("portfolio:public-portfolio", args=[username])
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["user"]["id"] == user.id
+
+    def test_ambiguous_local_part_is_not_found(self, api_client, create_user):
+        """Test a local part shared by two users does not resolve."""
+        create_user(email="sam@example.com")
+        create_user(email="sam@example.org")
+
+        url = reverse("portfolio:public-portfolio", args=["sam"])
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_payload_cached_until_content_changes(
+        self, api_client, create_user, django_capture_on_commit_callbacks
+    ):
+        """Test cached portfolios refresh after saves and bulk updates."""
+        user = create_user(email="jane@example.com")
+        project = Project.objects.create(user=user, title="One", description="x")
+        url = reverse("portfolio:public-portfolio", args=["jane"])
+
+        assert len(api_client.get(url).data["projects"]) == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Skill.objects.create(user=user, name="Python")
+        assert len(api_client.get(url).data["skills"]) == 1
+
+        api_client.force_authenticate(user=user)
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.post(
+                reverse("portfolio:bulk-operations"),
+                {
+                    "operation": "make_private",
+                    "model_type": "project",
+                    "ids": [project.id],
+                },
+                format="json",
+            )
+        assert api_client.get(url).data["projects"] == []
+
+    def test_views_tracked_on_cached_hits(
+        self, api_client, create_user, django_assert_num_queries
+    ):
+        """Test cached hits only resolve the user and record the view."""
+        user = create_user(email="jane@example.com")
+        url = reverse("portfolio:public-portfolio", args=["jane"])
+
+        api_client.get(url)
+        with django_assert_num_queries(2):
+            api_client.get(url)
+
+        assert ProfileView.objects.filter(user=user).count() == 2
+
+    def test_conditional_get(
+        self, api_client, create_user, django_capture_on_commit_callbacks
+    ):
+        """Test unchanged portfolios answer 304 and changes issue a new ETag."""
+        user = create_user(email="jane@example.com")
+        project = Project.objects.create(user=user, title="One", description="x")
+        portfolio_url = reverse("portfolio:public-portfolio", args=["jane"])
+        project_url = reverse("portfolio:public-project", args=["jane", project.slug])
+
+        etag = api_client.get(portfolio_url)["ETag"]
+        assert api_client.get(project_url)["ETag"] == etag
+        for url in (portfolio_url, project_url):
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert ProfileView.objects.filter(user=user).count() == 2
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Skill.objects.create(user=user, name="Python")
+        response = api_client.get(portfolio_url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+        assert len(response.data["skills"]) == 1
+
+    def test_experience_skills_are_prefetched(
+        self, api_client, create_user, django_assert_max_num_queries
+    ):
+        """Test rendering experiences and projects adds no per-row queries."""
+        user = create_user(email="jane@example.com")
+        skill = Skill.objects.create(user=user, name="Python")
+        for company in ("A", "B", "C"):
+            experience = Experience.objects.create(
+                user=user,
+                company=company,
+                position="Dev",
+                start_date=timezone.now().date(),
+            )
+            experience.skills.add(skill)
+            Project.objects.create(user=user, title=company, description="x")
+
+        url = reverse("portfolio:public-portfolio", args=["jane"])
+        with django_assert_max_num_queries(11):
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [len(e["skills"]) for e in response.data["experiences"]] == [1, 1, 1]
+
+
+@pytest.mark.django_db
+class TestResumeDownload:
+    """Tests for resume PDF generation."""
+
+    def test_download_renders_inline_without_celery(self, api_client, owner):
+        """Test the PDF is returned directly when Celery is disabled."""
+        response = api_client.get(reverse("portfolio:resume-download"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/pdf"
+        assert response.content.startswith(b"%PDF")
+
+    def test_download_queued_and_polled(self, api_client, owner, create_user, settings):
+        """Test the PDF is queued with Celery and served once rendered."""
+        settings.USE_CELERY = True
+        settings.REDIS_URL = "redis://localhost:6379/0"
+
+        with mock.patch.object(generate_resume_pdf_task, "apply_async") as apply_async:
+            response = api_client.get(reverse("portfolio:resume-download"))
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        task_id = response.data["task_id"]
+        apply_async.assert_called_once_with(args=[owner.id], task_id=task_id)
+        status_url = reverse("portfolio:resume-status", args=[task_id])
+        assert response.data["status_url"].endswith(status_url)
+
+        assert api_client.get(status_url).status_code == status.HTTP_202_ACCEPTED
+
+        generate_resume_pdf_task.apply(args=[owner.id], task_id=task_id)
+        response = api_client.get(status_url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.content.startswith(b"%PDF")
+
+        api_client.force_authenticate(user=create_user(email="other@example.com"))
+        assert api_client.get(status_url).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_unknown_and_failed_tasks(self, api_client, owner):
+        """Test unknown task ids are not found and failures report an error."""
+        url = reverse("portfolio:resume-status", args=["made-up"])
+        assert api_client.get(url).status_code == status.HTTP_404_NOT_FOUND
+
+        with mock.patch(
+            "portfolio.pdf_generator.generate_resume_pdf", side_effect=RuntimeError
+        ):
+            generate_resume_pdf_task.apply(args=[owner.id], task_id="task-2")
+        response = api_client.get(reverse("portfolio:resume-status", args=["task-2"]))
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert response.data["status"] == "failed"
+
+
+@pytest.mark.django_db
+class TestExportData:
+    """Tests for the data export endpoint."""
+
+    @staticmethod
+    def _export(api_client):
+        response = api_client.get(reverse("portfolio:export-data"))
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/json"
+        return json.loads(b"".join(response.streaming_content))
+
+    def test_export_theme(self, api_client, owner):
+        """Test the theme is exported when set and null otherwise."""
+        assert self._export(api_client)["theme"] is None
+
+        PortfolioTheme.objects.create(user=owner)
+        theme = self._export(api_client)["theme"]
+        assert theme["preset"] == PortfolioTheme.ThemePreset.PURPLE
+
+    def test_export_streams_all_sections(self, api_client, owner):
+        """Test every section is streamed as a valid JSON document."""
+        skill = Skill.objects.create(user=owner, name="Python")
+        for title in ("One", "Two"):
+            project = Project.objects.create(user=owner, title=title, description="x")
+            project.skills.add(skill)
+
+        data = self._export(api_client)
+
+        assert data["profile"]["email"] == owner.email
+        assert sorted(p["title"] for p in data["projects"]) == ["One", "Two"]
+        assert data["projects"][0]["skills"][0]["name"] == "Python"
+        assert [s["name"] for s in data["skills"]] == ["Python"]
+        assert data["experiences"] == []
+        assert data["social_links"] == []
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the Redis list commands used."""
+
+    def __init__(self):
+        self.lists = {}
+
+    def rpush(self, name, value):
+        self.lists.setdefault(name, []).append(value)
+
+    def lpop(self, name, count):
+        items = self.lists.get(name, [])
+        popped, self.lists[name] = items[:count], items[count:]
+        return popped or None
+
+
+@pytest.mark.django_db
+class TestViewQueue:
+    """Tests for buffered view tracking."""
+
+    def test_views_buffered_and_flushed(self, api_client, create_user, settings):
+        """Test views are queued in Redis and written by the flush task."""
+        settings.USE_CELERY = True
+        settings.REDIS_URL = "redis://localhost:6379/0"
+        user = create_user(email="jane@example.com")
+        project = Project.objects.create(user=user, title="One", description="x")
+        fake = FakeRedis()
+
+        with mock.patch("portfolio.tasks.get_redis", return_value=fake):
+            api_client.get(
+                reverse("portfolio:public-portfolio", args=["jane"]),
+                HTTP_USER_AGENT="Mozilla/5.0 (iPad)",
+            )
+            api_client.get(
+                reverse("portfolio:public-project", args=["jane", project.slug])
+            )
+            assert not ProfileView.objects.exists()
+            assert not ProjectView.objects.exists()
+
+            flush_view_queues()
+
+        assert ProfileView.objects.get(user=user).device_type == "tablet"
+        assert ProjectView.objects.filter(project=project).count() == 1
+
+
+@pytest.mark.django_db
+class TestSkills:
+    """Tests for skill endpoints."""
+
+    def test_by_category_groups_serialized_skills(self, api_client, owner):
+        """Test skills are grouped under their category display name."""
+        Skill.objects.create(user=owner, name="Django", category="backend")
+        Skill.objects.create(user=owner, name="React", category="frontend")
+        Skill.objects.create(user=owner, name="Python", category="backend")
+
+        response = api_client.get(reverse("portfolio:skill-by-category"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data) == {"Backend", "Frontend"}
+        assert [s["name"] for s in response.data["Backend"]] == ["Django", "Python"]
+        assert response.data["Frontend"][0]["category_display"] == "Frontend"
+
+
+@pytest.mark.django_db
+def test_save_assigns_unique_slugs_per_user(create_user):
+    """Test save() numbers colliding slugs within one user's projects only."""
+    owner, other = create_user(), create_user(email="other@example.com")
+    Project.objects.create(user=other, title="Web App", description="x")
+
+    slugs = [
+        Project.objects.create(user=owner, title="Web App", description="x").slug
+        for _ in range(3)
+    ]
+
+    assert slugs == ["web-app", "web-app-1", "web-app-2"]
+
+
+@pytest.mark.django_db
+class TestGitHubImport:
+    """Tests for the GitHub import endpoint."""
+
+    def test_import_skips_existing_and_assigns_slugs(self, api_client, owner):
+        """Test new repos are created with unique slugs in one batch."""
+        Project.objects.create(
+            user=owner,
+            title="Api",
+            description="x",
+            github_url="https://github.com/jane/api",
+        )
+        Project.objects.create(user=owner, title="Web App", description="x")
+        repos = [
+            {"name": "api", "html_url": "https://github.com/jane/api"},
+            {"name": "web-app", "html_url": "https://github.com/jane/web-app"},
+            {"name": "web_app", "html_url": "https://github.com/jane/web_app"},
+            {"name": "fork", "html_url": "https://github.com/jane/fork", "fork": True},
+        ]
+
+        with mock.patch("portfolio.views.github_session.get") as get:
+            get.return_value.json.return_value = repos
+            response = api_client.post(
+                reverse("portfolio:github-import"),
+                {"github_username": "jane"},
+                format="json",
+            )
+
+        assert response.data["imported"] == ["Web App", "Web App"]
+        assert response.data["skipped"] == ["api"]
+        slugs = set(Project.objects.filter(user=owner).values_list("slug", flat=True))
+        assert slugs == {"api", "web-app", "web-app-1", "web-app-2"}
+
+    @staticmethod
+    def _import(api_client, repos):
+        with mock.patch("portfolio.views.github_session.get") as get:
+            get.return_value.json.return_value = repos
+            return api_client.post(
+                reverse("portfolio:github-import"),
+                {"github_username": "jane"},
+                format="json",
+            )
+
+    def test_import_refreshes_dashboard_stats(
+        self, api_client, owner, django_capture_on_commit_callbacks
+    ):
+        """Test imported projects are counted instead of answering 304."""
+        url = reverse("portfolio:dashboard-stats")
+        etag = api_client.get(url)["ETag"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            self._import(
+                api_client, [{"name": "api", "html_url": "https://github.com/jane/api"}]
+            )
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["total_projects"] == 1
+
+    def test_import_reports_only_stored_rows(self, api_client, owner):
+        """Test rows dropped by ignore_conflicts are not reported as imported."""
+        bulk_create = Project.objects.bulk_create
+
+        def racing_bulk_create(objs, **kwargs):
+            # A concurrent request takes the slug picked for "web"
+            Project.objects.create(user=owner, title="Web", slug="web", description="x")
+            return bulk_create(objs, **kwargs)
+
+        repos = [
+            {"name": "api", "html_url": "https://github.com/jane/api"},
+            {"name": "web", "html_url": "https://github.com/jane/web"},
+        ]
+        with mock.patch.object(
+            Project.objects, "bulk_create", side_effect=racing_bulk_create
+        ):
+            response = self._import(api_client, repos)
+
+        assert response.data["imported"] == ["Api"]
+
+
+@pytest.mark.parametrize(
+    ("user_agent", "expected"),
+    [
+        ("", "desktop"),
+        ("Mozilla/5.0 (Windows NT 10.0; Win64; x64)", "desktop"),
+        ("Mozilla/5.0 (Linux; Android 14; Pixel 8)", "mobile"),
+        ("Mozilla/5.0 (iPad; CPU OS 17_0) Mobile/15E148", "mobile"),
+        ("Mozilla/5.0 (iPad; CPU OS 17_0)", "tablet"),
+        ("Mozilla/5.0 (X11; Tablet)", "tablet"),
+    ],
+)
+def test_get_device_type(user_agent, expected):
+    """Test User-Agent classification keeps mobile-first precedence."""
+    assert get_device_type(user_agent) == expected
@@ -55,6 +55,10 @@ interface ResumeData {
   }>;
 }
 
+// Give a queued resume about a minute to render before giving up
+const RESUME_POLL_INTERVAL_MS = 1000;
+const RESUME_POLL_MAX_ATTEMPTS = 60;
+
 const DownloadIcon = () => (
   <svg className="w-5 h-5" fill="none" stroke="currentColor" viewBox="0 0 24 24">
     <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M4 16v1a3 3 0 003 3h10a3 3 0 003-3v-1m-4-4l-4 4m0 0l-4-4m4 4V4" />
@@ -109,12 +113,24 @@ export default function ResumePage() {
   const handleDownloadPDF = async () => {
     try {
       setIsDownloading(true);
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000/api'}/portfolio/resume/download/`, {
-        headers: {
-          'Authorization': `Bearer ${localStorage.getItem('access_token')}`,
-        },
+      const headers = {
+        'Authorization': `Bearer ${localStorage.getItem('access_token')}`,
+      };
+      let response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000/api'}/portfolio/resume/download/`, {
+        headers,
       });
       
+      // Queued on a background worker: poll until the PDF is ready
+      if (response.status === 202) {
+        const { status_url } = await response.json();
+        let attempts = 0;
+        do {
+          if (++attempts > RESUME_POLL_MAX_ATTEMPTS) throw new Error('Timed out waiting for PDF');
+          await new Promise((resolve) => setTimeout(resolve, RESUME_POLL_INTERVAL_MS));
+          response = await fetch(status_url, { headers });
+        } while (response.status === 202);
+      }
+      
       if (!response.ok) throw new Error('Failed to download');
       
       const blob = await response.blob();